@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from advent.utils import data_dir
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+DAYS = range(1, 26)
+
+
+@dataclass(frozen=True)
+class Answers:
+    part_one: int
+    part_two: int | None = None
+
+
+def load(day: int) -> ModuleType:
+    # Each day provides parse(text), part_one(parsed) and - except on Christmas Day -
+    # part_two(parsed).
+    return importlib.import_module(f"advent.day{day:02}")
+
+
+def read_input(day: int) -> str:
+    puzzle = data_dir() / f"day{day:02}.txt"
+    return puzzle.read_text(encoding="utf-8")
+
+
+def run(day: int, text: str) -> Answers:
+    module = load(day)
+    parsed = module.parse(text)
+    part_one = module.part_one(parsed)
+    part_two = module.part_two(parsed) if hasattr(module, "part_two") else None
+    return Answers(part_one, part_two)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from advent import api, generate
+
+PARTS = {"part one": "part_one", "part two": "part_two"}
+
+type Timings = dict[str, list[float]]
+
+
+def time_once(day: int, text: str) -> dict[str, float]:
+    module = api.load(day)
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    parsed = module.parse(text)
+    timings["parse"] = time.perf_counter() - start
+
+    for phase, name in PARTS.items():
+        solver = getattr(module, name, None)
+        if solver is None:
+            continue
+
+        start = time.perf_counter()
+        solver(parsed)
+        timings[phase] = time.perf_counter() - start
+
+    return timings
+
+
+def time_day(day: int, repeat: int, scale: int | None = None) -> Timings | None:
+    try:
+        api.load(day)
+    except ModuleNotFoundError:
+        return None
+
+    if scale is None:
+        text = api.read_input(day)
+    elif day in generate.GENERATORS:
+        text = generate.generate(day, scale)
+    else:
+        return None
+
+    # Each run in a fresh interpreter, so that nothing memoized by one run - eg in a
+    # functools.cache - flatters the next.
+    context = multiprocessing.get_context("spawn")
+    timings: Timings = {phase: [] for phase in ("parse", *PARTS)}
+    with ProcessPoolExecutor(1, mp_context=context, max_tasks_per_child=1) as executor:
+        for run in executor.map(time_once, [day] * repeat, [text] * repeat):
+            for phase, seconds in run.items():
+                timings[phase].append(seconds)
+
+    return {phase: samples for phase, samples in timings.items() if samples}
+
+
+def percentile(samples: list[float], p: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+
+    return statistics.quantiles(samples, n=100, method="inclusive")[p - 1]
+
+
+def p_slower(baseline: list[float], current: list[float]) -> float:
+    # One-sided Mann-Whitney U test, using the normal approximation: how likely are we
+    # to see samples this slow, if nothing has changed?
+    n1, n2 = len(current), len(baseline)
+    u = sum((c > b) + 0.5 * (c == b) for c in current for b in baseline)
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sigma == 0:
+        return 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / sigma
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def milliseconds(seconds: float) -> str:
+    return f"{1000 * seconds:10.3f}ms"
+
+
+def report(results: dict[int, Timings]) -> None:
+    print(f"{'day':>3}  {'phase':<8}  {'min':>12}  {'median':>12}  {'p95':>12}")
+    for day, timings in results.items():
+        for phase, samples in timings.items():
+            least = milliseconds(min(samples))
+            median = milliseconds(statistics.median(samples))
+            p95 = milliseconds(percentile(samples, 95))
+            print(f"{day:>3}  {phase:<8}  {least}  {median}  {p95}")
+
+
+def compare(
+    baseline: dict[int, Timings],
+    results: dict[int, Timings],
+    *,
+    alpha: float,
+    threshold: float,
+) -> int:
+    regressions = 0
+    for day, timings in results.items():
+        for phase, samples in timings.items():
+            before = baseline.get(day, {}).get(phase)
+            if not before:
+                continue
+
+            old = statistics.median(before)
+            new = statistics.median(samples)
+            p = p_slower(before, samples)
+            if p < alpha and new > old * (1 + threshold):
+                regressions += 1
+                change = 100 * (new / old - 1)
+                print(
+                    f"Regression: day {day} {phase}: {milliseconds(old).strip()} -> "
+                    f"{milliseconds(new).strip()} (+{change:.1f}%, p={p:.4f})"
+                )
+
+    return regressions
+
+
+def load(path: Path) -> dict[int, Timings]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {int(day): timings for day, timings in data["days"].items()}
+
+
+def save(path: Path, results: dict[int, Timings]) -> None:
+    data = {"days": {str(day): timings for day, timings in results.items()}}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="advent bench")
+    parser.add_argument(
+        "days", type=int, nargs="*", default=list(api.DAYS), help="days to time"
+    )
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="runs per day (default: 5)"
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help="time generated inputs of this size, rather than the real ones",
+    )
+    parser.add_argument("--save", type=Path, help="write timings to this JSON file")
+    parser.add_argument(
+        "--compare", type=Path, help="flag regressions against this JSON file"
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="significance level for regressions (default: 0.01)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="ignore slowdowns smaller than this fraction (default: 0.05)",
+    )
+    args = parser.parse_args(argv)
+
+    results: dict[int, Timings] = {}
+    for day in args.days:
+        timings = time_day(day, args.repeat, args.scale)
+        if timings is not None:
+            results[day] = timings
+
+    report(results)
+
+    if args.save is not None:
+        save(args.save, results)
+
+    if args.compare is not None:
+        baseline = load(args.compare)
+        regressions = compare(
+            baseline, results, alpha=args.alpha, threshold=args.threshold
+        )
+        if regressions:
+            raise SystemExit(1)
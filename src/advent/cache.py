@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import ast
+import contextlib
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from advent import api
+from advent.api import Answers
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from importlib.machinery import ModuleSpec
+
+DEFAULT_LIMIT = 1024 * 1024  # bytes
+
+PACKAGE = "advent"
+
+
+def cache_dir() -> Path:
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "advent"
+
+
+def find_spec(name: str) -> ModuleSpec | None:
+    try:
+        return importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        # eg a parent that is a module, not a package.
+        return None
+
+
+def source(name: str) -> bytes:
+    spec = find_spec(name)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(name=name)
+
+    return Path(spec.origin).read_bytes()
+
+
+def imports(code: bytes) -> Iterator[str]:
+    # Every advent module that the code imports, in any style and wherever the import
+    # appears - lazy imports within functions included.
+    for node in ast.walk(ast.parse(code)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                # Relative imports: days live directly in the package.
+                base = PACKAGE if node.module is None else f"{PACKAGE}.{node.module}"
+            else:
+                base = node.module or ""
+
+            # from advent import utils: the names are modules themselves.
+            names = [base]
+            if base == PACKAGE:
+                names += [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        for name in names:
+            if name.partition(".")[0] == PACKAGE and find_spec(name) is not None:
+                yield name
+
+
+def sources(name: str) -> dict[str, bytes]:
+    # The module, and every advent module that it imports - directly or otherwise.
+    found: dict[str, bytes] = {}
+    pending = [name]
+    while pending:
+        module = pending.pop()
+        if module in found:
+            continue
+
+        found[module] = source(module)
+        pending.extend(imports(found[module]))
+
+    return found
+
+
+def key(day: int, text: str) -> str:
+    # Answers are good for as long as neither the input nor the code changes.  Days lean
+    # on other modules too, so those count as part of the code.
+    solver = hashlib.sha256()
+    for _, code in sorted(sources(f"advent.day{day:02}").items()):
+        solver.update(code)
+
+    puzzle = hashlib.sha256(text.encode())
+
+    digest = hashlib.sha256(solver.digest())
+    digest.update(puzzle.digest())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class AnswerCache:
+    directory: Path
+    limit: int = DEFAULT_LIMIT
+
+    def get(self, key: str) -> Answers | None:
+        path = self.directory / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            answers = Answers(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+        # Modification times record when each entry was last used.
+        with contextlib.suppress(OSError):
+            path.touch()
+
+        return answers
+
+    def put(self, key: str, answers: Answers) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+
+        # Write then rename, so that concurrent readers never see a partial entry.
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        data = json.dumps(dataclasses.asdict(answers))
+        temporary.write_text(data, encoding="utf-8")
+        temporary.replace(path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Least recently used goes first.
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.limit:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def run(self, day: int, text: str) -> Answers:
+        k = key(day, text)
+        answers = self.get(k)
+        if answers is None:
+            answers = api.run(day, text)
+            self.put(k, answers)
+
+        return answers
@@ -1,54 +1,177 @@
 from __future__ import annotations
 
-import contextlib
+import functools
+import itertools
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 
+from advent.api import Answers
 from advent.utils import data_dir
 
+BLOCK = 1 << 20  # bytes
 
-def get_numbers(line: str) -> list[int]:
-    numbers = []
-    for char in line:
-        with contextlib.suppress(ValueError):
-            number = int(char)
-            numbers.append(number)
-
-    return numbers
-
-
-def get_numbers2(line: str) -> list[int]:
-    subs = {str(n): n for n in range(1, 10)} | {
-        "one": 1,
-        "two": 2,
-        "three": 3,
-        "four": 4,
-        "five": 5,
-        "six": 6,
-        "seven": 7,
-        "eight": 8,
-        "nine": 9,
-    }
-
-    numbers = []
-    while line:
-        for k, v in subs.items():
-            if line.startswith(k):
-                numbers.append(v)
+DIGITS = {str(n): n for n in range(1, 10)}
+WORDS = DIGITS | {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+}
+
+
+@dataclass
+class Trie:
+    children: dict[str, Trie] = field(default_factory=dict)
+    value: int | None = None
+
+    @staticmethod
+    def from_words(words: dict[str, int]) -> Trie:
+        root = Trie()
+        for word, value in words.items():
+            node = root
+            for char in word:
+                node = node.children.setdefault(char, Trie())
+            node.value = value
+
+        return root
+
+    def match(self, line: str, start: int, step: int) -> int | None:
+        # Walk from start in the given direction, for as long as some word might match.
+        # No word is a prefix of another, so the first value we reach is the answer.
+        node = self
+        index = start
+        while 0 <= index < len(line):
+            child = node.children.get(line[index])
+            if child is None:
+                return None
+
+            if child.value is not None:
+                return child.value
+
+            node = child
+            index += step
+
+        return None
+
+
+FORWARD = Trie.from_words(WORDS)
+BACKWARD = Trie.from_words({word[::-1]: value for word, value in WORDS.items()})
+
+
+def calibrate(line: str) -> tuple[int, int]:
+    # Values for both parts at once.  Searching from each end stops at the first digit,
+    # which is as far as either part can need to go.
+    first: int | None = None
+    first_spelled: int | None = None
+    for index, char in enumerate(line):
+        if first_spelled is None:
+            first_spelled = FORWARD.match(line, index, 1)
+        if char in DIGITS:
+            first = DIGITS[char]
+            break
+
+    last: int | None = None
+    last_spelled: int | None = None
+    for index in range(len(line) - 1, -1, -1):
+        char = line[index]
+        if last_spelled is None:
+            last_spelled = BACKWARD.match(line, index, -1)
+        if char in DIGITS:
+            last = DIGITS[char]
+            break
+
+    plain = 0 if first is None or last is None else 10 * first + last
+    if first_spelled is None or last_spelled is None:
+        return plain, 0
+
+    return plain, 10 * first_spelled + last_spelled
+
+
+def parse(text: str) -> list[tuple[int, int]]:
+    return [calibrate(line) for line in text.splitlines()]
+
+
+def part_one(values: list[tuple[int, int]]) -> int:
+    return sum(plain for plain, _ in values)
+
+
+def part_two(values: list[tuple[int, int]]) -> int:
+    return sum(spelled for _, spelled in values)
+
+
+# Calibration documents can be much bigger than memory: so for those, stream the file in
+# blocks, and share the work between processes.
+
+
+def spans(path: Path, count: int) -> list[tuple[int, int]]:
+    # Split the file into about count pieces, each ending at the end of a line.
+    size = path.stat().st_size
+    if size == 0:
+        return []
+
+    bounds = [0]
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        for i in range(1, count):
+            newline = m.find(b"\n", max(bounds[-1], i * size // count))
+            if newline == -1:
+                break
+            bounds.append(newline + 1)
+
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in itertools.pairwise(bounds) if lo < hi]
+
+
+def calibrate_span(path: Path, span: tuple[int, int]) -> tuple[int, int]:
+    start, end = span
+    plain = spelled = 0
+    carry = b""
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(BLOCK, remaining))
+            if not block:
                 break
+            remaining -= len(block)
+
+            # Hold back any partial line until the next block completes it.
+            data = carry + block
+            cut = data.rfind(b"\n") + 1
+            carry = data[cut:]
+            for line in data[:cut].decode().splitlines():
+                p, s = calibrate(line)
+                plain += p
+                spelled += s
+
+    if carry:
+        p, s = calibrate(carry.decode())
+        plain += p
+        spelled += s
 
-        line = line[1:]
+    return plain, spelled
 
-    return numbers
 
+def solve_file(path: Path, jobs: int | None = None) -> Answers:
+    workers = jobs or os.cpu_count() or 1
+    task = functools.partial(calibrate_span, path)
+    with ProcessPoolExecutor(workers) as executor:
+        # Several pieces each, so that the workers all finish at about the same time.
+        partials = list(executor.map(task, spans(path, 4 * workers)))
 
-def solve() -> None:
-    puzzle = data_dir() / "day01.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
+    return Answers(sum(p for p, _ in partials), sum(s for _, s in partials))
 
-    numbers = [get_numbers(line) for line in lines]
-    values = [10 * ns[0] + ns[-1] for ns in numbers]
-    print(f"Part one: {sum(values)}")
 
-    numbers = [get_numbers2(line) for line in lines]
-    values = [10 * ns[0] + ns[-1] for ns in numbers]
-    print(f"Part two: {sum(values)}")
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else data_dir() / "day01.txt"
+    answers = solve_file(path)
+    print(f"Part one: {answers.part_one}")
+    print(f"Part two: {answers.part_two}")
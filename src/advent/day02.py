@@ -1,79 +1,82 @@
 from __future__ import annotations
 
+import itertools
+import math
 from dataclasses import dataclass
 
-from advent.utils import data_dir
+COLOURS = {"red": 0, "green": 1, "blue": 2}
+MAXIMUM = (12, 13, 14)
 
+# Fewer rounds than this are quicker in plain Python than it is to import numpy.
+BATCH = 100000
 
-@dataclass(frozen=True)
-class Cubes:
-    red: int
-    green: int
-    blue: int
-
-    @staticmethod
-    def from_string(string: str) -> Cubes:
-        red = green = blue = 0
-        parts = string.split(", ")
-
-        for part in parts:
-            number, colour = part.split()
-            count = int(number)
-            match colour:
-                case "red":
-                    red = count
-                case "green":
-                    green = count
-                case "blue":
-                    blue = count
-                case other:
-                    message = f"unexpected colour {other}"
-                    raise AssertionError(message)
-
-        return Cubes(red, green, blue)
-
-    def possible(self, maximum: Cubes) -> bool:
-        return (
-            self.red <= maximum.red
-            and self.green <= maximum.green
-            and self.blue <= maximum.blue
-        )
-
-    def power(self) -> int:
-        return self.red * self.green * self.blue
+type Cubes = tuple[int, int, int]
 
 
 @dataclass(frozen=True)
-class Game:
-    number: int
-    rounds: list[Cubes]
+class Rounds:
+    # One entry per round, across all games: which game, and how many red, green, blue.
+    games: list[int]
+    cubes: list[Cubes]
 
     @staticmethod
-    def from_string(string: str) -> Game:
-        header, body = string.split(": ")
-        _game, number = header.split()
-        rounds = [Cubes.from_string(round_) for round_ in body.split("; ")]
-        return Game(int(number), rounds)
-
-    def possible(self, maximum: Cubes) -> bool:
-        return all(round_.possible(maximum) for round_ in self.rounds)
-
-    def minimum(self) -> Cubes:
-        red = max(round_.red for round_ in self.rounds)
-        green = max(round_.green for round_ in self.rounds)
-        blue = max(round_.blue for round_ in self.rounds)
-        return Cubes(red, green, blue)
-
-
-def solve() -> None:
-    puzzle = data_dir() / "day02.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
-    games = [Game.from_string(line) for line in lines]
-
-    maximum = Cubes(red=12, green=13, blue=14)
-    part_one = sum(game.number for game in games if game.possible(maximum))
-    print(f"Part one: {part_one}")
-
-    part_two = sum(game.minimum().power() for game in games)
-    print(f"Part two: {part_two}")
+    def from_string(text: str) -> Rounds:
+        games: list[int] = []
+        counts: list[Cubes] = []
+        for line in text.splitlines():
+            header, body = line.split(": ")
+            number = int(header.split()[1])
+            for round_ in body.split("; "):
+                cubes = [0, 0, 0]
+                for part in round_.split(", "):
+                    count, colour = part.split()
+                    cubes[COLOURS[colour]] = int(count)
+
+                games.append(number)
+                counts.append((cubes[0], cubes[1], cubes[2]))
+
+        return Rounds(games, counts)
+
+    def minimums(self) -> tuple[list[int], list[Cubes]]:
+        # Each game's rounds are contiguous: so take the largest count of each colour
+        # from where each game starts until the next.
+        if len(self.games) >= BATCH:
+            return self.minimums_array()
+
+        games: list[int] = []
+        minimums: list[Cubes] = []
+        rounds = zip(self.games, self.cubes, strict=True)
+        for game, group in itertools.groupby(rounds, key=lambda r: r[0]):
+            reds, greens, blues = zip(*(cubes for _, cubes in group), strict=True)
+            games.append(game)
+            minimums.append((max(reds), max(greens), max(blues)))
+
+        return games, minimums
+
+    def minimums_array(self) -> tuple[list[int], list[Cubes]]:
+        # numpy is expensive to import, so wait until there's enough work to pay for it.
+        import numpy as np
+
+        games = np.array(self.games, dtype=np.int64)
+        cubes = np.array(self.cubes, dtype=np.int64)
+        starts = np.flatnonzero(np.diff(games, prepend=games[:1] - 1))
+        reds, greens, blues = np.maximum.reduceat(cubes, starts, axis=0).T.tolist()
+        return games[starts].tolist(), list(zip(reds, greens, blues, strict=True))
+
+
+def parse(text: str) -> Rounds:
+    return Rounds.from_string(text)
+
+
+def part_one(rounds: Rounds) -> int:
+    games, minimums = rounds.minimums()
+    return sum(
+        game
+        for game, cubes in zip(games, minimums, strict=True)
+        if all(c <= m for c, m in zip(cubes, MAXIMUM, strict=True))
+    )
+
+
+def part_two(rounds: Rounds) -> int:
+    _, minimums = rounds.minimums()
+    return sum(math.prod(cubes) for cubes in minimums)
@@ -1,67 +1,61 @@
 from __future__ import annotations
 
-import itertools
+import re
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
 
-from advent.utils import data_dir
+from advent.utils import Grid
 
-if TYPE_CHECKING:
-    from advent.utils import Coord2
+NUMBER = re.compile(rb"\d+")
+SYMBOL = re.compile(rb"[^0-9.\n]")
+STAR = ord("*")
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day03.txt"
-    data = puzzle.read_text(encoding="utf-8")
+@dataclass(frozen=True)
+class Schematic:
+    parts: list[int]
+    gears: dict[int, list[int]]  # star -> [adjacent part]
 
-    # Parse.
-    grid: dict[Coord2, str] = {}
-    for row, line in enumerate(data.splitlines()):
-        for col, char in enumerate(line):
-            grid[row, col] = char
-    rows = row + 1
-    cols = col + 1
 
-    # Map out active locations, and locations next to stars.
-    active: set[Coord2] = set()
-    starry: dict[Coord2, Coord2] = {}  # location -> adjacent star
-    for row, col in itertools.product(range(rows), range(cols)):
-        if grid[row, col] in ".0123456879":
-            continue
+def parse(text: str) -> Schematic:
+    grid = Grid.from_string(text)
+    cells = grid.cells
+    stride = grid.stride
 
-        for r, c in itertools.product((row - 1, row, row + 1), (col - 1, col, col + 1)):
-            active.add((r, c))
-            if grid[row, col] == "*":
-                starry[r, c] = (row, col)
-
-    # Find parts, and gears.
     parts: list[int] = []
-    gears: dict[Coord2, list[int]] = defaultdict(list)  # star -> [adjacent part]
-
-    live = False
-    star: Coord2 | None = None
-    number: int | None = None
-
-    for row, col in itertools.product(range(rows), range(cols)):
-        digit = grid[row, col] in "0123456789"
-        if digit:
-            live = live or (row, col) in active
-            star = star or starry.get((row, col))
-            number = number or 0
-            number *= 10
-            number += int(grid[row, col])
-
-        if number is not None and (not digit or col + 1 == cols):
-            if live:
-                parts.append(number)
-                live = False
-            if star is not None:
+    gears: dict[int, list[int]] = defaultdict(list)
+
+    # Numbers never run across a newline, so one search over the whole grid finds them
+    # all.  Their neighbours are the rows above and below, one wider at each end: which
+    # never wraps, because off the end of a row there's always a newline.
+    for match in NUMBER.finditer(cells):
+        start, end = match.span()
+        number = int(match[0])
+
+        adjacent = False
+        for row in (start - 1 - stride, start - 1, start - 1 + stride):
+            lo = max(row, 0)
+            hi = min(row + end - start + 2, len(cells))
+            if lo >= hi:
+                continue
+
+            adjacent = adjacent or SYMBOL.search(cells, lo, hi) is not None
+
+            star = cells.find(STAR, lo, hi)
+            while star != -1:
                 gears[star].append(number)
-                star = None
-            number = None
+                star = cells.find(STAR, star + 1, hi)
+
+        if adjacent:
+            parts.append(number)
+
+    return Schematic(parts, gears)
+
+
+def part_one(schematic: Schematic) -> int:
+    return sum(schematic.parts)
 
-    part_one = sum(parts)
-    print(f"Part one: {part_one}")
 
-    part_two = sum((gs[0] * gs[1]) for gs in gears.values() if len(gs) == 2)
-    print(f"Part two: {part_two}")
+def part_two(schematic: Schematic) -> int:
+    gears = schematic.gears.values()
+    return sum((gs[0] * gs[1]) for gs in gears if len(gs) == 2)
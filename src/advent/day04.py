@@ -1,52 +1,98 @@
 from __future__ import annotations
 
+import sys
+from collections import deque
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from advent.api import Answers
 from advent.utils import data_dir
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def bitmask(numbers: str) -> int:
+    mask = 0
+    for n in numbers.split():
+        mask |= 1 << int(n)
+
+    return mask
+
 
 @dataclass(frozen=True)
 class Card:
     number: int
-    winners: set[int]
-    mine: set[int]
+    winners: int  # bitmask
+    mine: int  # bitmask
 
     @staticmethod
     def from_string(string: str) -> Card:
         header, body = string.split(": ")
         _card, number = header.split()
         winners, mine = body.split("| ")
-        ws = {int(w) for w in winners.split()}
-        ms = {int(m) for m in mine.split()}
-        return Card(int(number), ws, ms)
+        return Card(int(number), bitmask(winners), bitmask(mine))
 
     def matches(self) -> int:
-        matches = self.winners & self.mine
-        return len(matches)
+        return (self.winners & self.mine).bit_count()
 
     def score(self) -> int:
         matches = self.matches()
-        score: int = 0 if matches == 0 else 2 ** (matches - 1)
-        return score
-
+        return 0 if matches == 0 else 1 << (matches - 1)
 
-def solve() -> None:
-    puzzle = data_dir() / "day04.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
-    cards = [Card.from_string(line) for line in lines]
 
-    part_one = sum(card.score() for card in cards)
-    print(f"Part one: {part_one}")
-
-    counts = {card.number: 1 for card in cards}
+def count_copies(cards: Iterable[Card]) -> int:
+    # A running difference array: pending[k] is how many more copies the kth card from
+    # here has than the card before it.  Cards only win copies of the next few cards, so
+    # only that many differences are ever pending.
+    total = 0
+    copies = 0
+    pending: deque[int] = deque()
     for card in cards:
-        count = counts[card.number]
+        copies += pending.popleft() if pending else 0
+        count = 1 + copies
+        total += count
+
         matches = card.matches()
-        for n in range(card.number + 1, card.number + matches + 1):
-            if n > len(cards):
-                continue
-            counts[n] += count
+        if matches:
+            pending.extend([0] * (matches + 1 - len(pending)))
+            pending[0] += count
+            pending[matches] -= count
+
+    return total
+
+
+def parse(text: str) -> list[Card]:
+    return [Card.from_string(line) for line in text.splitlines()]
+
+
+def part_one(cards: list[Card]) -> int:
+    return sum(card.score() for card in cards)
+
+
+def part_two(cards: list[Card]) -> int:
+    return count_copies(cards)
+
+
+def solve_file(path: Path) -> Answers:
+    # One card at a time, so that memory does not grow with the file.
+    score = 0
+
+    def cards() -> Iterable[Card]:
+        nonlocal score
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                card = Card.from_string(line.rstrip("\n"))
+                score += card.score()
+                yield card
+
+    copies = count_copies(cards())
+    return Answers(score, copies)
+
 
-    part_two = sum(counts.values())
-    print(f"Part two: {part_two}")
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else data_dir() / "day04.txt"
+    answers = solve_file(path)
+    print(f"Part one: {answers.part_one}")
+    print(f"Part two: {answers.part_two}")
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import bisect
+import functools
 import itertools
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from advent.utils import chunks, data_dir
+import numpy as np
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
-@dataclass(frozen=True)
-class Range:
-    start: int
-    length: int
+type Array = npt.NDArray[np.int64]
 
 
 @dataclass(frozen=True)
@@ -23,101 +25,115 @@ class Map:
         numbers = (int(n) for n in string.split())
         return Map(*numbers)
 
-    def plumb(self, start: int) -> int | None:
-        if self.source <= start < self.source + self.length:
-            return start + self.dest - self.source
-
-        return None
-
-    def plumb_range(self, range_: Range) -> tuple[list[Range], list[Range]]:
-        # Describe ranges as (lo, hi): exclusive at upper end.
-        map_lo, map_hi = self.source, self.source + self.length
-        range_lo, range_hi = range_.start, range_.start + range_.length
-
-        # Calculate boundaries: what part of the range is below this map, overlaps it,
-        # above this map?
-        lo_hi = min(range_hi, map_lo)
-        overlap_lo = max(range_lo, map_lo)
-        overlap_hi = min(range_hi, map_hi)
-        hi_lo = max(range_lo, map_hi)
-
-        # Accordingly, what part of the range is moved and unmoved?
-        moved: list[Range] = []
-        unmoved: list[Range] = []
-        if range_lo < lo_hi:
-            unmoved.append(Range(range_lo, lo_hi - range_lo))
 
-        if overlap_lo < overlap_hi:
-            moved.append(
-                Range(overlap_lo + self.dest - self.source, overlap_hi - overlap_lo)
-            )
-
-        if hi_lo < range_hi:
-            unmoved.append(Range(hi_lo, range_hi - hi_lo))
-
-        return moved, unmoved
-
-    def plumb_ranges(self, ranges: list[Range]) -> tuple[list[Range], list[Range]]:
-        moved: list[Range] = []
-        unmoved: list[Range] = []
-        for r in ranges:
-            m, u = self.plumb_range(r)
-            moved += m
-            unmoved += u
-
-        return moved, unmoved
+def merged(starts: list[int], offsets: list[int]) -> Piecewise:
+    # Neighbouring pieces with the same offset are really one piece.
+    keep = [i for i in range(len(starts)) if i == 0 or offsets[i] != offsets[i - 1]]
+    return Piecewise([starts[i] for i in keep], [offsets[i] for i in keep])
 
 
 @dataclass(frozen=True)
-class Block:
-    maps: list[Map]
+class Piecewise:
+    # A function that adds offsets[i] to everything from starts[i] up to starts[i + 1].
+    #
+    # starts are ascending, beginning at zero, and the last piece goes on for ever.
+    starts: list[int]
+    offsets: list[int]
 
     @staticmethod
-    def from_lines(lines: list[str]) -> Block:
-        maps = [Map.from_string(line) for line in lines[1:]]
-        return Block(maps)
-
-    def plumb(self, start: int) -> int:
-        for m in self.maps:
-            out = m.plumb(start)
-            if out is not None:
-                return out
-
-        return start
-
-    def plumb_ranges(self, ranges: list[Range]) -> list[Range]:
-        moved: list[Range] = []
-        unmoved = ranges
-        for m in self.maps:
-            new_moved, unmoved = m.plumb_ranges(unmoved)
-            moved += new_moved
-
-        return moved + unmoved
+    def from_maps(maps: list[Map]) -> Piecewise:
+        starts: list[int] = []
+        offsets: list[int] = []
+        end = 0
+        for m in sorted(maps, key=lambda m: m.source):
+            if m.source > end:
+                starts.append(end)
+                offsets.append(0)
+
+            starts.append(m.source)
+            offsets.append(m.dest - m.source)
+            end = m.source + m.length
+
+        starts.append(end)
+        offsets.append(0)
+
+        return merged(starts, offsets)
+
+    def piece(self, value: int) -> int:
+        return bisect.bisect_right(self.starts, value) - 1
+
+    def then(self, other: Piecewise) -> Piecewise:
+        # The function that applies self, and then other.
+        starts: list[int] = []
+        offsets: list[int] = []
+        ends = [*self.starts[1:], None]
+        for start, end, offset in zip(self.starts, ends, self.offsets, strict=True):
+            # This piece lands on other's pieces from j onwards.
+            j = other.piece(start + offset)
+            lo = start
+            while True:
+                starts.append(lo)
+                offsets.append(offset + other.offsets[j])
+                if j + 1 == len(other.starts):
+                    break
+
+                lo = other.starts[j + 1] - offset
+                if end is not None and lo >= end:
+                    break
+
+                j += 1
+
+        return merged(starts, offsets)
+
+    def arrays(self) -> tuple[Array, Array, Array]:
+        starts = np.array(self.starts, dtype=np.int64)
+        ends = np.append(starts[1:], np.iinfo(np.int64).max)
+        return starts, ends, np.array(self.offsets, dtype=np.int64)
+
+    def apply(self, values: Array) -> Array:
+        starts, _, offsets = self.arrays()
+        pieces = np.searchsorted(starts, values, side="right") - 1
+        return values + offsets[pieces]
+
+    def apply_ranges(self, lo: Array, hi: Array) -> tuple[Array, Array]:
+        # Ranges are [lo, hi).  Each covers some run of consecutive pieces: so list out
+        # every (range, piece) pair, and clip each range to each of its pieces.
+        starts, ends, offsets = self.arrays()
+        first = np.searchsorted(starts, lo, side="right") - 1
+        last = np.searchsorted(starts, hi - 1, side="right") - 1
+        counts = last - first + 1
+        runs = np.cumsum(counts) - counts
+        steps = np.arange(counts.sum()) - np.repeat(runs, counts)
+        pieces = np.repeat(first, counts) + steps
+
+        piece_lo = np.maximum(np.repeat(lo, counts), starts[pieces])
+        piece_hi = np.minimum(np.repeat(hi, counts), ends[pieces])
+        return merge_ranges(piece_lo + offsets[pieces], piece_hi + offsets[pieces])
+
+
+def merge_ranges(lo: Array, hi: Array) -> tuple[Array, Array]:
+    # Overlapping or touching ranges become one, so that repeated mapping does not leave
+    # ever more fragments.
+    if len(lo) == 0:
+        return lo, hi
+
+    order = np.argsort(lo, kind="stable")
+    lo, hi = lo[order], hi[order]
+    reach = np.maximum.accumulate(hi)
+    fresh = np.ones(len(lo), dtype=bool)
+    fresh[1:] = lo[1:] > reach[:-1]
+    groups = np.flatnonzero(fresh)
+    return lo[groups], np.maximum.reduceat(hi, groups)
 
 
 @dataclass(frozen=True)
-class Chain:
-    blocks: list[Block]
-
-    def plumb(self, start: int) -> int:
-        value = start
-        for block in self.blocks:
-            value = block.plumb(value)
-
-        return value
-
-    def plumb_ranges(self, ranges: list[Range]) -> list[Range]:
-        output = ranges
-        for block in self.blocks:
-            output = block.plumb_ranges(output)
+class Almanac:
+    seeds: list[int]
+    mapping: Piecewise  # all the way from seed to location
 
-        return output
 
-
-def solve() -> None:
-    puzzle = data_dir() / "day05.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
+def parse(text: str) -> Almanac:
+    lines = text.splitlines()
 
     _, values = lines[0].split(": ")
     seeds = [int(n) for n in values.split()]
@@ -125,14 +141,21 @@ def solve() -> None:
     sections = [
         list(section) for key, section in itertools.groupby(lines[1:], key=bool) if key
     ]
-    blocks = [Block.from_lines(section) for section in sections]
-    chain = Chain(blocks)
 
-    locations = [chain.plumb(seed) for seed in seeds]
-    part_one = min(locations)
-    print(f"Part one: {part_one}")
+    # Compose the blocks up front, so that every seed is just one lookup.
+    blocks = [
+        Piecewise.from_maps([Map.from_string(line) for line in section[1:]])
+        for section in sections
+    ]
+    return Almanac(seeds, functools.reduce(Piecewise.then, blocks))
+
+
+def part_one(almanac: Almanac) -> int:
+    seeds = np.array(almanac.seeds, dtype=np.int64)
+    return int(almanac.mapping.apply(seeds).min())
+
 
-    seed_ranges = list(itertools.starmap(Range, chunks(seeds, 2)))
-    output_ranges = chain.plumb_ranges(seed_ranges)
-    part_two = min(r.start for r in output_ranges)
-    print(f"Part two: {part_two}")
+def part_two(almanac: Almanac) -> int:
+    starts, lengths = np.array(almanac.seeds, dtype=np.int64).reshape(-1, 2).T
+    lo, _ = almanac.mapping.apply_ranges(starts, starts + lengths)
+    return int(lo.min())
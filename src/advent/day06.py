@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import itertools
 import math
 
-from advent.utils import data_dir
+# Below these, t * t and 4 * record fit comfortably in an int64.
+SMALL_TIME = 1 << 31
+SMALL_RECORD = 1 << 60
+
+# Fewer races than this are solved sooner one at a time than by importing numpy.
+BATCH = 50000
 
 
 def ways_to_beat(record: int, t: int) -> int:
@@ -11,27 +15,72 @@ def ways_to_beat(record: int, t: int) -> int:
     #
     # x^2 - tx + record < 0
     discriminant = t * t - 4 * record
-    lo_root = (t - math.sqrt(discriminant)) / 2
+    if discriminant <= 0:
+        return 0
+
+    # Start near the lower root, then correct to the first integer that wins.
+    lo = (t - math.isqrt(discriminant)) // 2
+    while lo * (t - lo) <= record and lo <= t // 2:
+        lo += 1
+    while lo > 0 and (lo - 1) * (t - lo + 1) > record:
+        lo -= 1
 
-    # We want the next integer.
-    lo = int(lo_root) + 1
     hi = t - lo
+    return max(0, hi - lo + 1)
+
+
+def ways_to_beat_many(records: list[int], times: list[int]) -> list[int]:
+    if len(times) < BATCH or max(times) >= SMALL_TIME or max(records) >= SMALL_RECORD:
+        # Too few to be worth numpy, or too big for exact arithmetic in it.
+        return [ways_to_beat(r, t) for r, t in zip(records, times, strict=True)]
+
+    return ways_to_beat_array(records, times)
+
+
+def ways_to_beat_array(records: list[int], times: list[int]) -> list[int]:
+    # numpy is expensive to import, so wait until we actually need it.
+    import numpy as np
 
-    return hi - lo + 1
+    rs = np.array(records, dtype=np.int64)
+    ts = np.array(times, dtype=np.int64)
 
+    # Floating point gets us within one of the lower root, and integers do the rest.
+    discriminant = ts * ts - 4 * rs
+    roots = np.sqrt(np.maximum(discriminant, 0).astype(np.float64))
+    lo = ((ts - roots) // 2).astype(np.int64)
+    for _ in range(2):
+        lo += lo * (ts - lo) <= rs
+    for _ in range(2):
+        lo -= (lo > 0) & ((lo - 1) * (ts - lo + 1) > rs)
 
-def solve() -> None:
-    puzzle = data_dir() / "day06.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
+    ways = np.maximum(ts - 2 * lo + 1, 0)
+    values: list[int] = np.where(discriminant > 0, ways, 0).tolist()
+    return values
+
+
+def concatenate(numbers: list[int]) -> int:
+    # Arithmetic rather than int(str), which refuses very long strings of digits.
+    value = 0
+    for n in numbers:
+        value = value * 10 ** len(str(n)) + n
+
+    return value
+
+
+def parse(text: str) -> tuple[list[int], list[int]]:
+    lines = text.splitlines()
     times = [int(n) for n in lines[0].split()[1:]]
     distances = [int(n) for n in lines[1].split()[1:]]
+    return times, distances
+
+
+def part_one(races: tuple[list[int], list[int]]) -> int:
+    times, distances = races
+    return math.prod(ways_to_beat_many(distances, times))
 
-    values = itertools.starmap(ways_to_beat, zip(distances, times, strict=True))
-    part_one = math.prod(values)
-    print(f"Part one: {part_one}")
 
-    big_time = int("".join(str(n) for n in times))
-    big_distance = int("".join(str(n) for n in distances))
-    part_two = ways_to_beat(big_distance, big_time)
-    print(f"Part two: {part_two}")
+def part_two(races: tuple[list[int], list[int]]) -> int:
+    times, distances = races
+    big_time = concatenate(times)
+    big_distance = concatenate(distances)
+    return ways_to_beat(big_distance, big_time)
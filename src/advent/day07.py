@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 VALUES = {str(n): n for n in range(2, 10)} | {
     "T": 10,
@@ -49,42 +49,61 @@ def classify(counts: list[int]) -> int:
     return Kind.HIGH_CARD
 
 
-@dataclass(frozen=True)
-class Hand:
-    values: list[int]
+def partitions(n: int, most: int | None = None) -> Iterator[list[int]]:
+    # Ways of writing n as a sum, largest parts first.
+    if n == 0:
+        yield []
+        return
 
-    def kind(self) -> int:
-        counter = Counter(self.values)
-        weak_jacks = counter.pop(1, 0)
-        counts = sorted(counter.values(), reverse=True) or [0]
-        counts[0] += weak_jacks
-        return classify(counts)
+    for first in range(min(n, most or n), 0, -1):
+        for rest in partitions(n - first, first):
+            yield [first, *rest]
 
 
-@dataclass(frozen=True)
-class Play:
-    hand: Hand
-    bid: int
+# The sum of the squares of the counts of each card is enough to tell apart the ways
+# that cards can be grouped: so this table gives the kind of hand, from that and from
+# how many jokers there are.
+KINDS = {
+    (jokers, sum(c * c for c in counts)): classify(
+        [counts[0] + jokers, *counts[1:]] if counts else [jokers]
+    )
+    for jokers in range(6)
+    for counts in partitions(5 - jokers)
+}
+
+
+def key(faces: str, table: dict[str, int], *, jokers: bool = False) -> int:
+    # Kind, then each card in turn, four bits apiece.
+    wild = faces.count("J") if jokers else 0
+    rest = faces.replace("J", "") if jokers else faces
+    squares = sum(rest.count(face) for face in rest)
+
+    packed = KINDS[wild, squares]
+    for face in faces:
+        packed = packed << 4 | table[face]
+
+    return packed
+
+
+def winnings(plays: list[tuple[str, int]], *, jokers: bool = False) -> int:
+    table = VALUES2 if jokers else VALUES
+    keys = [key(faces, table, jokers=jokers) for faces, _ in plays]
+    order = sorted(range(len(plays)), key=keys.__getitem__)
+    return sum(rank * plays[i][1] for rank, i in enumerate(order, 1))
+
+
+def parse(text: str) -> list[tuple[str, int]]:
+    plays: list[tuple[str, int]] = []
+    for line in text.splitlines():
+        faces, bid = line.split()
+        plays.append((faces, int(bid)))
 
-    @staticmethod
-    def from_string(string: str, *, part_two: bool = False) -> Play:
-        table = VALUES2 if part_two else VALUES
-        faces, bid = string.split()
-        values = [table[face] for face in faces]
-        hand = Hand(values)
-        return Play(hand, int(bid))
+    return plays
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day07.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def part_one(plays: list[tuple[str, int]]) -> int:
+    return winnings(plays)
 
-    plays = [Play.from_string(string) for string in data.splitlines()]
-    plays = sorted(plays, key=lambda play: (play.hand.kind(), play.hand.values))
-    part_one = sum(index * play.bid for index, play in enumerate(plays, 1))
-    print(f"Part one: {part_one}")
 
-    plays = [Play.from_string(string, part_two=True) for string in data.splitlines()]
-    plays = sorted(plays, key=lambda play: (play.hand.kind(), play.hand.values))
-    part_two = sum(index * play.bid for index, play in enumerate(plays, 1))
-    print(f"Part two: {part_two}")
+def part_two(plays: list[tuple[str, int]]) -> int:
+    return winnings(plays, jokers=True)
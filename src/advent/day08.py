@@ -1,59 +1,200 @@
 from __future__ import annotations
 
-import itertools
+import functools
 import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable
+
+    import numpy.typing as npt
+
+type Hit = tuple[int, int]  # step, target
 
 
 @dataclass(frozen=True)
-class Node:
-    name: str
-    left: str
-    right: str
+class Network:
+    instructions: list[int]  # 0 for left, 1 for right
+    names: list[str]
+    indexes: dict[str, int]
+    moves: tuple[list[int], list[int]]  # left, right: from each node, by index
 
     @staticmethod
-    def from_string(string: str) -> Node:
-        name, nodes = string.split(" = ")
-        left, right = nodes.split(", ")
-        return Node(name, left[1:], right[:-1])
-
-
-def solve() -> None:
-    puzzle = data_dir() / "day08.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
-
-    instructions = lines[0]
-    nodes = [Node.from_string(line) for line in data.splitlines()[2:]]
-    node_map = {node.name: node for node in nodes}
-
-    position = "AAA"
-    count = 0
-    for instruction in itertools.cycle(instructions):
-        if position == "ZZZ":
-            break
-
-        count += 1
-        node = node_map[position]
-        position = node.left if instruction == "L" else node.right
-
-    print(f"Part one: {count}")
-
-    starts = {node.name for node in nodes if node.name.endswith("A")}
-    lengths: list[int] = []
-    for start in starts:
-        position = start
-        count = 0
-        for instruction in itertools.cycle(instructions):
-            if position.endswith("Z"):
-                lengths.append(count)
-                break
-
-            count += 1
-            node = node_map[position]
-            position = node.left if instruction == "L" else node.right
-
-    part_two = math.lcm(*lengths)
-    print(f"Part two: {part_two}")
+    def from_string(text: str) -> Network:
+        lines = text.splitlines()
+        instructions = [0 if c == "L" else 1 for c in lines[0]]
+
+        nodes: list[tuple[str, str, str]] = []
+        for line in lines[2:]:
+            name, pair = line.split(" = ")
+            left, right = pair[1:-1].split(", ")
+            nodes.append((name, left, right))
+
+        names = [name for name, _, _ in nodes]
+        indexes = {name: i for i, name in enumerate(names)}
+        lefts = [indexes[n] for _, n, _ in nodes]
+        rights = [indexes[n] for _, _, n in nodes]
+        return Network(instructions, names, indexes, (lefts, rights))
+
+    def index(self, name: str) -> int:
+        return self.indexes[name]
+
+
+@dataclass(frozen=True)
+class Timeline:
+    # The times at which a ghost is on a target.
+    #
+    # That is: every time in tail, and every time in cycle plus any multiple of period.
+    tail: list[int]
+    cycle: list[int]
+    period: int
+
+    def __contains__(self, time: int) -> bool:
+        if time in self.tail:
+            return True
+
+        return any(time >= c and (time - c) % self.period == 0 for c in self.cycle)
+
+    def first(self) -> int | None:
+        return min(self.tail + self.cycle, default=None)
+
+    def meet(self, other: Timeline) -> Timeline:
+        # The times at which both ghosts are on a target.
+        tail = {t for t in self.tail if t in other}
+        tail |= {t for t in other.tail if t in self}
+
+        cycle: set[int] = set()
+        period = math.lcm(self.period, other.period)
+        for c1 in self.cycle:
+            for c2 in other.cycle:
+                solution = crt(c1, self.period, c2, other.period)
+                if solution is None:
+                    continue
+
+                # Earliest time that both cycles have reached.
+                residue, _ = solution
+                earliest = max(c1, c2)
+                cycle.add(earliest + (residue - earliest) % period)
+
+        return Timeline(sorted(tail), sorted(cycle), period)
+
+
+def crt(a1: int, m1: int, a2: int, m2: int) -> tuple[int, int] | None:
+    # Solve x = a1 mod m1, x = a2 mod m2, for moduli that need not be coprime.
+    g = math.gcd(m1, m2)
+    if (a2 - a1) % g != 0:
+        return None
+
+    lcm = m1 // g * m2
+    k = (a2 - a1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    return (a1 + k * m1) % lcm, lcm
+
+
+@dataclass(frozen=True)
+class Lockstep:
+    # Walks many ghosts through the same network at once, one numpy step for all of
+    # them.
+    #
+    # Compile once per network, then run as many sets of starting nodes as you like.
+    instructions: npt.NDArray[np.intp]
+    moves: npt.NDArray[np.intp]  # moves[instruction, node]
+
+    @staticmethod
+    def from_network(network: Network) -> Lockstep:
+        instructions = np.array(network.instructions, dtype=np.intp)
+        moves = np.array(network.moves, dtype=np.intp)
+        return Lockstep(instructions, moves)
+
+    def run(
+        self, starts: Iterable[int], targets: Iterable[int], steps: int
+    ) -> tuple[npt.NDArray[np.intp], list[list[Hit]]]:
+        # Where each ghost is after so many steps, and when it was on which target.
+        on_target = np.zeros(self.moves.shape[1], dtype=bool)
+        on_target[list(targets)] = True
+
+        positions = np.array(list(starts), dtype=np.intp)
+        hits: list[list[Hit]] = [[] for _ in positions]
+        for step in range(steps):
+            for ghost in np.flatnonzero(on_target[positions]):
+                hits[ghost].append((step, int(positions[ghost])))
+
+            instruction = self.instructions[step % len(self.instructions)]
+            positions = self.moves[instruction, positions]
+
+        return positions, hits
+
+    def jumps(self, targets: Iterable[int]) -> Jumps:
+        # One pass through the instructions from every node, all together.
+        nodes = range(self.moves.shape[1])
+        ends, hits = self.run(nodes, targets, len(self.instructions))
+        return Jumps(len(self.instructions), ends.tolist(), hits)
+
+
+@dataclass(frozen=True)
+class Jumps:
+    # Where each node ends up after one pass through the instructions, and at which
+    # steps along the way it is on which target.
+    length: int
+    ends: list[int]
+    hits: list[list[Hit]]
+
+    def timeline(self, start: int, targets: Container[int]) -> Timeline:
+        # The times at which a ghost from start is on one of these targets: which may be
+        # any of those that the jumps were made for.
+        # Passes start from a node, so once a node repeats, so does everything after.
+        seen: dict[int, int] = {}
+        times: list[list[int]] = []
+        node = start
+        while node not in seen:
+            seen[node] = len(times)
+            times.append(
+                [
+                    len(times) * self.length + step
+                    for step, target in self.hits[node]
+                    if target in targets
+                ]
+            )
+            node = self.ends[node]
+
+        loop = seen[node]
+        tail = [t for ts in times[:loop] for t in ts]
+        cycle = [t for ts in times[loop:] for t in ts]
+        return Timeline(tail, cycle, (len(times) - loop) * self.length)
+
+
+@dataclass(frozen=True)
+class Wasteland:
+    network: Network
+    jumps: Jumps  # for every target in either part
+
+
+def parse(text: str) -> Wasteland:
+    # Compile the network and make its jump table once, for both parts.
+    network = Network.from_string(text)
+    targets = [i for i, name in enumerate(network.names) if name.endswith("Z")]
+    jumps = Lockstep.from_network(network).jumps(targets)
+    return Wasteland(network, jumps)
+
+
+def part_one(wasteland: Wasteland) -> int:
+    network = wasteland.network
+    timeline = wasteland.jumps.timeline(network.index("AAA"), {network.index("ZZZ")})
+    first = timeline.first()
+    assert first is not None
+    return first
+
+
+def part_two(wasteland: Wasteland) -> int:
+    network = wasteland.network
+    targets = {i for i, name in enumerate(network.names) if name.endswith("Z")}
+    timelines = [
+        wasteland.jumps.timeline(i, targets)
+        for i, name in enumerate(network.names)
+        if name.endswith("A")
+    ]
+    first = functools.reduce(Timeline.meet, timelines).first()
+    assert first is not None
+    return first
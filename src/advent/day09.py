@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import itertools
+import math
+import operator
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+LIMIT = 1 << 63
 
 
 def extrapolate(sequence: list[int], *, backwards: bool = False) -> int:
@@ -16,15 +24,113 @@ def extrapolate(sequence: list[int], *, backwards: bool = False) -> int:
     )
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day09.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    sequences = [[int(n) for n in line.split()] for line in data.splitlines()]
+@dataclass
+class Extrapolator:
+    # Predicts the next value of a sequence that arrives one value at a time.
+    #
+    # Keeps only the last value at each level of differences: the prediction is their
+    # sum, just as extrapolate() would give for the whole history.
+    #
+    # Like extrapolate(), stop at the first level that is all zeros: so that the depth
+    # is bounded by the degree of the sequence, not by how many values have arrived.
+    # Only the bottom level can be all zeros, since nothing is ever below one.
+    tails: list[int] = field(default_factory=list)
+    zeros: int = 0  # how many zeros the bottom level holds, if it holds nothing else
+
+    @staticmethod
+    def from_sequence(sequence: Iterable[int]) -> Extrapolator:
+        extrapolator = Extrapolator()
+        for value in sequence:
+            extrapolator.push(value)
+
+        return extrapolator
+
+    def push(self, value: int) -> None:
+        # Each level's new tail is the difference between the new and old tails above.
+        for level in range(len(self.tails) - (self.zeros > 0)):
+            tail = self.tails[level]
+            self.tails[level] = value
+            value -= tail
+
+        if value == 0:
+            # All zeros at the bottom still, so every level below would be too.
+            if not self.zeros:
+                self.tails.append(0)
+
+            self.zeros += 1
+            return
+
+        if self.zeros:
+            # Below n zeros and then a value are n more levels, each ending in it.
+            self.tails[-1] = value
+            self.tails += [value] * self.zeros
+            self.zeros = 0
+            return
+
+        self.tails.append(value)
+
+    def predict(self) -> int:
+        return sum(self.tails)
+
+
+def weights(n: int, *, backwards: bool = False) -> list[int]:
+    # Extrapolating n values is a fixed weighted sum of them: these are the weights.
+    if backwards:
+        return [(-1) ** k * math.comb(n, k + 1) for k in range(n)]
+
+    return [(-1) ** (n - 1 - k) * math.comb(n, k) for k in range(n)]
+
+
+def product(rows: list[list[int]], ws: list[int]) -> list[int] | None:
+    # The weighted sums in int64, or None if they might overflow.
+    #
+    # numpy is expensive to import, so wait until we actually need it.
+    import numpy as np
+
+    try:
+        matrix = np.array(rows, dtype=np.int64)
+    except OverflowError:
+        return None
+
+    biggest = int(np.abs(matrix).max(initial=0))
+    if sum(abs(w) for w in ws) * biggest >= LIMIT:
+        return None
+
+    values: list[int] = (matrix @ np.array(ws, dtype=np.int64)).tolist()
+    return values
+
+
+def extrapolate_all(
+    sequences: list[list[int]], *, backwards: bool = False
+) -> list[int]:
+    # Sequences of the same length all take the same weights: so group them, and make
+    # each group a single matrix-vector product.
+    by_length: dict[int, list[int]] = defaultdict(list)
+    for index, sequence in enumerate(sequences):
+        by_length[len(sequence)].append(index)
+
+    results = [0] * len(sequences)
+    for n, indexes in by_length.items():
+        ws = weights(n, backwards=backwards)
+        rows = [sequences[i] for i in indexes]
+        values = product(rows, ws)
+        if values is None:
+            # Too big for int64: Python integers are slower, but never overflow.
+            values = [sum(map(operator.mul, ws, row)) for row in rows]
+
+        for index, value in zip(indexes, values, strict=True):
+            results[index] = value
+
+    return results
+
+
+def parse(text: str) -> list[list[int]]:
+    return [[int(n) for n in line.split()] for line in text.splitlines()]
+
+
+def part_one(sequences: list[list[int]]) -> int:
+    return sum(extrapolate_all(sequences))
 
-    extrapolations = (extrapolate(sequence) for sequence in sequences)
-    part_one = sum(extrapolations)
-    print(f"Part one: {part_one}")
 
-    extrapolations = (extrapolate(sequence, backwards=True) for sequence in sequences)
-    part_two = sum(extrapolations)
-    print(f"Part two: {part_two}")
+def part_two(sequences: list[list[int]]) -> int:
+    return sum(extrapolate_all(sequences, backwards=True))
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from advent.utils import Coord2, data_dir
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-type Grid = dict[Coord2, str]
+from advent.utils import Grid
+
+if TYPE_CHECKING:
+    from advent.utils import Coord2
 
 NORTH = (-1, 0)
 SOUTH = (1, 0)
@@ -10,50 +14,62 @@ EAST = (0, 1)
 WEST = (0, -1)
 
 TURNS = {
-    "-": {EAST: EAST, WEST: WEST},
-    "J": {EAST: NORTH, SOUTH: WEST},
-    "7": {EAST: SOUTH, NORTH: WEST},
-    "F": {NORTH: EAST, WEST: SOUTH},
-    "|": {NORTH: NORTH, SOUTH: SOUTH},
-    "L": {SOUTH: EAST, WEST: NORTH},
+    ord("-"): {EAST: EAST, WEST: WEST},
+    ord("J"): {EAST: NORTH, SOUTH: WEST},
+    ord("7"): {EAST: SOUTH, NORTH: WEST},
+    ord("F"): {NORTH: EAST, WEST: SOUTH},
+    ord("|"): {NORTH: NORTH, SOUTH: SOUTH},
+    ord("L"): {SOUTH: EAST, WEST: NORTH},
+}
+
+
+# Arriving at a tile going one way, which way do we leave?
+TRANSITIONS = {
+    (tile, arriving): leaving
+    for tile, turns in TURNS.items()
+    for arriving, leaving in turns.items()
 }
 
 
 def find_loop_going(
-    grid: Grid, start: Coord2, direction: Coord2
-) -> list[Coord2] | None:
-    loop = [start]
-    row, col = start
-    drow, dcol = direction
+    grid: Grid, start: int, direction: Coord2
+) -> tuple[int, int] | None:
+    # Returns the length of the loop, and twice its area - or None if there's no loop
+    # this way.
+    #
+    # https://en.wikipedia.org/wiki/Shoelace_formula - accumulated as we go, so that
+    # we never need to keep the loop.
+    cells = grid.cells
+    offsets = {d: grid.offset(d) for d in (NORTH, SOUTH, EAST, WEST)}
+    index = start
+    row, col = grid.coord(start)
+    length = 0
+    area = 0
 
     while True:
+        drow, dcol = direction
+        area += row * dcol - drow * col
         row += drow
         col += dcol
-        if (row, col) == start:
-            return loop
-        loop.append((row, col))
+        length += 1
 
-        value = grid.get((row, col))
-        if value is None:
+        index += offsets[direction]
+        if not 0 <= index < len(cells):
             # Gone off the edge of the grid.
             return None
 
-        turntable = TURNS.get(value)
-        if turntable is None:
-            # Entered a tile with no pipe.
-            return None
+        if index == start:
+            return length, abs(area)
 
-        new_direction = turntable.get((drow, dcol))
+        # None if there's no pipe here, or if it does not join our loop.
+        new_direction = TRANSITIONS.get((cells[index], direction))
         if new_direction is None:
-            # Entered a tile whose pipe does not join our loop.
             return None
 
-        drow, dcol = new_direction
-
-    raise AssertionError
+        direction = new_direction
 
 
-def find_loop(grid: Grid, start: Coord2) -> list[Coord2]:
+def find_loop(grid: Grid, start: int) -> tuple[int, int]:
     for starting_direction in (NORTH, SOUTH, EAST, WEST):
         loop = find_loop_going(grid, start, starting_direction)
         if loop is not None:
@@ -62,36 +78,26 @@ def find_loop(grid: Grid, start: Coord2) -> list[Coord2]:
     raise AssertionError
 
 
-def get_area(loop: list[Coord2]) -> int:
-    # https://en.wikipedia.org/wiki/Shoelace_formula
-    value = 0
-    for j in range(len(loop)):
-        xi, yi = loop[j - 1]
-        xj, yj = loop[j]
-        value += (xi * yj) - (xj * yi)
+@dataclass(frozen=True)
+class Maze:
+    grid: Grid
+    start: int
 
-    # Area is obviously an integer.
-    value = abs(value)
-    return value // 2
 
+def parse(text: str) -> Maze:
+    grid = Grid.from_string(text)
+    return Maze(grid, grid.find("S"))
 
-def solve() -> None:
-    puzzle = data_dir() / "day10.txt"
-    data = puzzle.read_text(encoding="utf-8")
-
-    grid: Grid = {}
-    start: Coord2
-    for row, line in enumerate(data.splitlines()):
-        for col, char in enumerate(line):
-            grid[(row, col)] = char
-            if char == "S":
-                start = (row, col)
 
+def part_one(maze: Maze) -> int:
     # Loop is of even length - every step north must be undone by a matching step south,
     # and so on.
-    loop = find_loop(grid, start)
-    part_one = len(loop) // 2
-    print(f"Part one: {part_one}")
+    length, _ = find_loop(maze.grid, maze.start)
+    return length // 2
+
+
+def part_two(maze: Maze) -> int:
+    length, double_area = find_loop(maze.grid, maze.start)
 
     # https://en.wikipedia.org/wiki/Pick%27s_theorem
     #
@@ -102,6 +108,4 @@ def solve() -> None:
     # - there are four more right than left turns
     #
     # giving (of course!) the same answer.
-    area = get_area(loop)
-    part_two = area - part_one + 1
-    print(f"Part two: {part_two}")
+    return double_area // 2 - length // 2 + 1
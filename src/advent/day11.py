@@ -1,42 +1,57 @@
 from __future__ import annotations
 
-import itertools
 from typing import TYPE_CHECKING
 
-from advent.utils import data_dir, manhattan
-
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from advent.utils import Coord2
 
 
-def recalibrate(galaxies: set[Coord2], *, expansion: int = 2) -> set[Coord2]:
-    occupied_rows = {r for r, _ in galaxies}
-    rows = max(occupied_rows)
-    row_sizes = [1 if r in occupied_rows else expansion for r in range(rows)]
-    row_coords = list(itertools.accumulate(row_sizes, initial=0))
+def pairwise_sum(values: list[int]) -> int:
+    # Sum of |a - b| over all pairs: sorted, each value is subtracted by everything
+    # after it and subtracts everything before it.
+    n = len(values)
+    return sum(value * (2 * i - n + 1) for i, value in enumerate(sorted(values)))
+
+
+def spread(coords: list[int]) -> tuple[int, int]:
+    # Total distance along one axis between all pairs: as it stands, and the number of
+    # empty lines crossed, each of which grows with the expansion.
+    occupied = sorted(set(coords))
+    rank = {c: i for i, c in enumerate(occupied)}
+    empties = [c - rank[c] for c in coords]
+    return pairwise_sum(coords), pairwise_sum(empties)
 
-    occupied_cols = {c for _, c in galaxies}
-    cols = max(occupied_cols)
-    col_sizes = [1 if c in occupied_cols else expansion for c in range(cols)]
-    col_coords = list(itertools.accumulate(col_sizes, initial=0))
 
-    return {(row_coords[r], col_coords[c]) for (r, c) in galaxies}
+def distances(galaxies: set[Coord2], expansions: Iterable[int]) -> list[int]:
+    # Distances are linear in the expansion, so that one pass serves every expansion.
+    rows, cols = zip(*galaxies, strict=True)
+    base = 0
+    extra = 0
+    for coords in (rows, cols):
+        b, e = spread(list(coords))
+        base += b
+        extra += e
 
+    return [base + (expansion - 1) * extra for expansion in expansions]
 
-def solve() -> None:
-    puzzle = data_dir() / "day11.txt"
-    data = puzzle.read_text(encoding="utf-8")
 
+def parse(text: str) -> set[Coord2]:
     galaxies: set[Coord2] = set()
-    for row, line in enumerate(data.splitlines()):
+    for row, line in enumerate(text.splitlines()):
         for col, char in enumerate(line):
             if char == "#":
                 galaxies.add((row, col))
 
-    expanded = recalibrate(galaxies)
-    part_one = sum(itertools.starmap(manhattan, itertools.combinations(expanded, 2)))
-    print(f"Part one: {part_one}")
+    return galaxies
+
+
+def part_one(galaxies: set[Coord2]) -> int:
+    [distance] = distances(galaxies, [2])
+    return distance
+
 
-    expanded = recalibrate(galaxies, expansion=1000000)
-    part_two = sum(itertools.starmap(manhattan, itertools.combinations(expanded, 2)))
-    print(f"Part two: {part_two}")
+def part_two(galaxies: set[Coord2]) -> int:
+    [distance] = distances(galaxies, [1000000])
+    return distance
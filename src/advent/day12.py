@@ -3,8 +3,6 @@ from __future__ import annotations
 import functools
 from dataclasses import dataclass
 
-from advent.utils import data_dir
-
 
 @dataclass(frozen=True)
 class Record:
@@ -39,15 +37,13 @@ def possibilities(text: str, pattern: tuple[int, ...]) -> int:
     return total
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day12.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    records = [Record.from_string(line) for line in data.splitlines()]
+def parse(text: str) -> list[Record]:
+    return [Record.from_string(line) for line in text.splitlines()]
+
+
+def part_one(records: list[Record]) -> int:
+    return sum(possibilities(r.line, r.pattern) for r in records)
 
-    part_one = sum(possibilities(r.line, r.pattern) for r in records)
-    print(f"Part one: {part_one}")
 
-    part_two = sum(
-        possibilities("?".join([r.line] * 5), r.pattern * 5) for r in records
-    )
-    print(f"Part two: {part_two}")
+def part_two(records: list[Record]) -> int:
+    return sum(possibilities("?".join([r.line] * 5), r.pattern * 5) for r in records)
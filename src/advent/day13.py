@@ -3,8 +3,6 @@ from __future__ import annotations
 import itertools
 from dataclasses import dataclass
 
-from advent.utils import data_dir
-
 
 def mirrors(lines: list[str], mirror: int) -> bool:
     length = min(mirror, len(lines) - mirror)
@@ -73,18 +71,17 @@ class Grid:
         return col_mirror
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day13.txt"
-    data = puzzle.read_text(encoding="utf-8")
-
-    grids = [
+def parse(text: str) -> list[Grid]:
+    return [
         Grid(list(section))
-        for key, section in itertools.groupby(data.splitlines(), key=bool)
+        for key, section in itertools.groupby(text.splitlines(), key=bool)
         if key
     ]
 
-    part_one = sum(grid.summary() for grid in grids)
-    print(f"Part one: {part_one}")
 
-    part_two = sum(grid.summary2() for grid in grids)
-    print(f"Part two: {part_two}")
+def part_one(grids: list[Grid]) -> int:
+    return sum(grid.summary() for grid in grids)
+
+
+def part_two(grids: list[Grid]) -> int:
+    return sum(grid.summary2() for grid in grids)
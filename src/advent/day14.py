@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from advent.utils import data_dir
-
 
 def tip_section(section: str) -> str:
     marbles = section.count("O")
@@ -61,17 +59,16 @@ class Grid:
         return "".join(self.rows)
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day14.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> Grid:
+    return Grid(text.splitlines())
 
-    lines = data.splitlines()
-    grid = Grid(lines)
 
+def part_one(grid: Grid) -> int:
     tipped = grid.tip_north()
-    part_one = tipped.load()
-    print(f"Part one: {part_one}")
+    return tipped.load()
+
 
+def part_two(grid: Grid) -> int:
     keys: dict[str, int] = {}
     loads: list[int] = []
     cycle = 0
@@ -91,5 +88,4 @@ def solve() -> None:
 
     offset = (1000000000 - previously - 1) % cycle_length
     index = previously + offset
-    part_two = loads[index]
-    print(f"Part two: {part_two}")
+    return loads[index]
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from collections import defaultdict
 
-from advent.utils import data_dir
-
 
 def advent_hash(text: str) -> int:
     value = 0
@@ -15,15 +13,16 @@ def advent_hash(text: str) -> int:
     return value
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day15.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> list[str]:
+    return text.strip().split(",")
+
 
-    steps = data.strip().split(",")
+def part_one(steps: list[str]) -> int:
     hashes = (advent_hash(step) for step in steps)
-    part_one = sum(hashes)
-    print(f"Part one: {part_one}")
+    return sum(hashes)
+
 
+def part_two(steps: list[str]) -> int:
     boxes: dict[int, list[tuple[str, int]]] = defaultdict(list)
     for lens in steps:
         if lens.endswith("-"):
@@ -49,5 +48,4 @@ def solve() -> None:
         for box_number, box in boxes.items()
         for slot, (_, focal_length) in enumerate(box, 1)
     )
-    part_two = sum(powers)
-    print(f"Part two: {part_two}")
+    return sum(powers)
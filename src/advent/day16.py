@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from advent.utils import Coord2, data_dir
+from advent.utils import Coord2
 
 type Grid = list[str]
 type State = tuple[Coord2, Coord2]
@@ -82,14 +82,13 @@ class Layout:
         return max(lights)
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day16.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> Layout:
+    return Layout.from_string(text)
 
-    layout = Layout.from_string(data)
 
-    part_one = layout.energize()
-    print(f"Part one: {part_one}")
+def part_one(layout: Layout) -> int:
+    return layout.energize()
 
-    part_two = layout.most_energized()
-    print(f"Part two: {part_two}")
+
+def part_two(layout: Layout) -> int:
+    return layout.most_energized()
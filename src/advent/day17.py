@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import heapq
-from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from advent.utils import Coord2, data_dir
+from advent.utils import NEWLINE, Grid
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -15,11 +14,11 @@ SOUTH = (1, 0)
 EAST = (0, 1)
 WEST = (0, -1)
 
+ZERO = ord("0")
+UNREACHED = 1 << 62
 
-type Grid = dict[Coord2, int]
-
-# boolean for whether we are moving north-south, or east-west.
-type State = tuple[Coord2, bool]
+# Index into the grid, and whether we are moving north-south or east-west.
+type State = tuple[int, bool]
 
 
 @dataclass(frozen=True)
@@ -28,34 +27,26 @@ class Layout:
 
     @staticmethod
     def from_string(text: str) -> Layout:
-        grid = {
-            (row, col): int(char)
-            for row, line in enumerate(text.splitlines())
-            for col, char in enumerate(line)
-        }
-
-        return Layout(grid)
+        return Layout(Grid.from_string(text))
 
     # Returns new state, and cost of getting to that new state.
     def neighbours(
         self, state: State, *, part_two: bool = False
     ) -> Iterator[tuple[State, int]]:
         position, north_south = state
-        for drow, dcol in (NORTH, SOUTH) if north_south else (EAST, WEST):
-            new_row, new_col = position
+        cells = self.grid.cells
+        for direction in (NORTH, SOUTH) if north_south else (EAST, WEST):
+            offset = self.grid.offset(direction)
+            new_position = position
             cost = 0
 
             lo, hi = (4, 10) if part_two else (1, 3)
             for step in range(1, hi + 1):
-                new_row += drow
-                new_col += dcol
-                new_position = (new_row, new_col)
-
-                step_cost = self.grid.get(new_position)
-                if step_cost is None:
+                new_position += offset
+                if not 0 <= new_position < len(cells) or cells[new_position] == NEWLINE:
                     break
 
-                cost += step_cost
+                cost += cells[new_position] - ZERO
 
                 if step < lo:
                     continue
@@ -63,38 +54,43 @@ class Layout:
                 yield (new_position, not north_south), cost
 
     def solve(self, *, part_two: bool = False) -> int:
-        goal = max(self.grid)
-        start = (0, 0)
+        goal = self.grid.index(self.grid.rows - 1, self.grid.cols - 1)
+        start = 0
 
         queue: list[tuple[int, State]] = [(0, (start, True)), (0, (start, False))]
         heapq.heapify(queue)
-        costs: dict[State, int] = defaultdict(lambda: 100000)
+
+        # Costs by state, at 2 * position + north_south.
+        costs = [UNREACHED] * 2 * len(self.grid.cells)
 
         while queue:
             cost, state = heapq.heappop(queue)
+            position, north_south = state
 
-            if cost > costs[state]:
+            if cost > costs[2 * position + north_south]:
                 continue
 
-            if state[0] == goal:
+            if position == goal:
                 return cost
 
             for new_state, cost_delta in self.neighbours(state, part_two=part_two):
                 new_cost = cost + cost_delta
-                if new_cost < costs[new_state]:
-                    costs[new_state] = new_cost
+                new_position, new_north_south = new_state
+                key = 2 * new_position + new_north_south
+                if new_cost < costs[key]:
+                    costs[key] = new_cost
                     heapq.heappush(queue, (new_cost, new_state))
 
         raise AssertionError
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day17.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> Layout:
+    return Layout.from_string(text)
+
+
+def part_one(layout: Layout) -> int:
+    return layout.solve()
 
-    layout = Layout.from_string(data)
-    part_one = layout.solve()
-    print(f"Part one: {part_one}")
 
-    part_two = layout.solve(part_two=True)
-    print(f"Part two: {part_two}")
+def part_two(layout: Layout) -> int:
+    return layout.solve(part_two=True)
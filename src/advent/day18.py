@@ -3,8 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
-
 if TYPE_CHECKING:
     from advent.utils import Coord2
 
@@ -68,17 +66,16 @@ def get_area(loop: list[Coord2]) -> int:
     return value // 2
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day18.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> list[Instruction]:
+    return [Instruction.from_string(line) for line in text.splitlines()]
 
-    instructions = [Instruction.from_string(line) for line in data.splitlines()]
 
+def part_one(instructions: list[Instruction]) -> int:
     # Day 10 redux.
     corners, length = build_loop(instructions)
-    part_one = get_area(corners) + (length // 2) + 1
-    print(f"Part one: {part_one}")
+    return get_area(corners) + (length // 2) + 1
+
 
+def part_two(instructions: list[Instruction]) -> int:
     corners, length = build_loop(instructions, part_two=True)
-    part_two = get_area(corners) + (length // 2) + 1
-    print(f"Part two: {part_two}")
+    return get_area(corners) + (length // 2) + 1
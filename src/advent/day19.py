@@ -6,8 +6,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import override
 
-from advent.utils import data_dir
-
 
 @dataclass(frozen=True)
 class Part:
@@ -210,10 +208,14 @@ def accepted_volume(workflows: dict[str, Workflow], start: Parts) -> int:
     return volume
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day19.txt"
-    data = puzzle.read_text(encoding="utf-8")
-    lines = data.splitlines()
+@dataclass(frozen=True)
+class System:
+    workflows: dict[str, Workflow]
+    parts: list[Part]
+
+
+def parse(text: str) -> System:
+    lines = text.splitlines()
 
     sections = (
         list(section) for key, section in itertools.groupby(lines, key=bool) if key
@@ -221,11 +223,15 @@ def solve() -> None:
     workflows = [Workflow.from_text(line) for line in next(sections)]
     workflow_map = {w.name: w for w in workflows}
     parts = [Part.from_text(line) for line in next(sections)]
+    return System(workflow_map, parts)
+
+
+def part_one(system: System) -> int:
+    workflows = system.workflows
+    return sum(part.rating() for part in system.parts if accepted(workflows, part))
 
-    part_one = sum(part.rating() for part in parts if accepted(workflow_map, part))
-    print(f"Part one: {part_one}")
 
+def part_two(system: System) -> int:
     ranges = {var: Range(1, 4001) for var in "xmas"}
     start = Parts(ranges)
-    part_two = accepted_volume(workflow_map, start)
-    print(f"Part two: {part_two}")
+    return accepted_volume(system.workflows, start)
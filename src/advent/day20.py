@@ -4,9 +4,10 @@ import math
 from abc import ABC, abstractmethod, abstractproperty
 from collections import deque
 from dataclasses import dataclass, field
-from typing import override
+from typing import TYPE_CHECKING, override
 
-from advent.utils import data_dir
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @dataclass(frozen=True)
@@ -85,11 +86,8 @@ class Conjunction(Module):
         ]
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day20.txt"
-    data = puzzle.read_text(encoding="utf-8")
-
-    module_list = [Module.from_text(line) for line in data.splitlines()]
+def build(lines: list[str]) -> dict[str, Module]:
+    module_list = [Module.from_text(line) for line in lines]
     modules = {module.name: module for module in module_list}
     for module in module_list:
         for destination in module.destinations:
@@ -97,37 +95,55 @@ def solve() -> None:
             if isinstance(dest_module, Conjunction):
                 dest_module.inputs[module.name] = False
 
-    button_counter = 0
-    low_pulses = 0
-    high_pulses = 0
+    return modules
 
-    # There is a conjunction pointing at rx, we need all four of its inputs to be high.
-    rx_input = next(module for module in module_list if "rx" in module.destinations)
-    rx_input_cycles: dict[str, int] = {}
 
-    while len(rx_input_cycles) < 4:
-        if button_counter == 1000:
-            part_one = low_pulses * high_pulses
+def press(modules: dict[str, Module]) -> Iterator[Pulse]:
+    queue = deque([Pulse("button", "broadcaster", value=False)])
+    while queue:
+        pulse = queue.popleft()
+        yield pulse
 
-        button_counter += 1
+        dest_module = modules.get(pulse.destination)
+        if dest_module is not None:
+            pulses = dest_module.react(pulse)
+            queue.extend(pulses)
+
+
+# Modules are stateful, so each part builds its own from the puzzle text.
+def parse(text: str) -> list[str]:
+    return text.splitlines()
 
-        queue = deque([Pulse("button", "broadcaster", value=False)])
-        while queue:
-            pulse = queue.popleft()
+
+def part_one(lines: list[str]) -> int:
+    modules = build(lines)
+
+    low_pulses = 0
+    high_pulses = 0
+    for _ in range(1000):
+        for pulse in press(modules):
             if pulse.value:
                 high_pulses += 1
             else:
                 low_pulses += 1
 
-            if pulse.destination == rx_input.name and pulse.value:
-                rx_input_cycles.setdefault(pulse.source, button_counter)
+    return low_pulses * high_pulses
 
-            dest_module = modules.get(pulse.destination)
-            if dest_module is not None:
-                pulses = dest_module.react(pulse)
-                queue.extend(pulses)
 
-    print(f"Part one: {part_one}")
+def part_two(lines: list[str]) -> int:
+    modules = build(lines)
+
+    # There is a conjunction pointing at rx, we need all four of its inputs to be high.
+    rx_input = next(
+        module for module in modules.values() if "rx" in module.destinations
+    )
+    rx_input_cycles: dict[str, int] = {}
+
+    button_counter = 0
+    while len(rx_input_cycles) < 4:
+        button_counter += 1
+        for pulse in press(modules):
+            if pulse.destination == rx_input.name and pulse.value:
+                rx_input_cycles.setdefault(pulse.source, button_counter)
 
-    part_two = math.lcm(*rx_input_cycles.values())
-    print(f"Part two: {part_two}")
+    return math.lcm(*rx_input_cycles.values())
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
 import itertools
-from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from advent.utils import Coord2, data_dir
+from advent.utils import Grid
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from advent.utils import Coord2
+
 NORTH = (-1, 0)
 SOUTH = (1, 0)
 EAST = (0, 1)
 WEST = (0, -1)
 
-
-type Grid = dict[Coord2, str]
+ROCK = ord("#")
 
 
 @dataclass(frozen=True)
@@ -27,79 +27,71 @@ class Layout:
     num_cols: int = field(init=False)
 
     def __post_init__(self) -> None:
-        start = next(k for k, v in self.grid.items() if v == "S")
-        max_row, max_col = max(self.grid)
+        start = self.grid.coord(self.grid.find("S"))
         object.__setattr__(self, "start", start)
-        object.__setattr__(self, "num_rows", max_row + 1)
-        object.__setattr__(self, "num_cols", max_col + 1)
+        object.__setattr__(self, "num_rows", self.grid.rows)
+        object.__setattr__(self, "num_cols", self.grid.cols)
 
     @staticmethod
     def from_string(text: str) -> Layout:
-        grid = {
-            (row, col): char
-            for row, line in enumerate(text.splitlines())
-            for col, char in enumerate(line)
-        }
-
-        return Layout(grid)
+        return Layout(Grid.from_string(text))
 
+    # The garden repeats infinitely, so positions are not confined to the grid.
     def neighbours(self, state: Coord2) -> Iterator[Coord2]:
         row, col = state
         for drow, dcol in (NORTH, SOUTH, EAST, WEST):
             new_row = row + drow
             new_col = col + dcol
-            new_position = new_row, new_col
 
-            effective_row = new_row % self.num_rows
-            effective_col = new_col % self.num_cols
+            if self.grid.wrapped(new_row, new_col) != ROCK:
+                yield new_row, new_col
 
-            if self.grid[(effective_row, effective_col)] != "#":
-                yield new_position
+    def reachable(self, checkpoints: list[int]) -> list[int]:
+        # How many plots can be reached in exactly each (ascending) number of steps?
+        counts: list[int] = []
+        reached = [0, 0]  # plots first reached at an even, odd distance
 
-    def solve(self, steps: int, target: int) -> tuple[int, list[int]]:
-        part_one: int | None = None
-        sequence: list[int] = []
+        visited: set[Coord2] = {self.start}
+        frontier = [self.start]
+        for distance in itertools.count():
+            reached[distance % 2] += len(frontier)
+            if distance == checkpoints[len(counts)]:
+                counts.append(reached[distance % 2])
+                if len(counts) == len(checkpoints):
+                    return counts
 
-        visited: set[Coord2] = set()
-        queue: deque[tuple[int, Coord2]] = deque([(0, self.start)])
+            next_frontier: list[Coord2] = []
+            for position in frontier:
+                for new_position in self.neighbours(position):
+                    if new_position not in visited:
+                        visited.add(new_position)
+                        next_frontier.append(new_position)
 
-        next_checkpoint = target % self.num_cols
-        while queue:
-            cost, position = queue.popleft()
-            if part_one is None and cost > steps:
-                part_one = sum((row + col + cost) % 2 for row, col in visited)
+            frontier = next_frontier
 
-            if cost > next_checkpoint:
-                value = sum((row + col + cost) % 2 for row, col in visited)
-                sequence.append(value)
-                next_checkpoint += self.num_cols
+        raise AssertionError
 
-            if part_one is not None and len(sequence) > 2:
-                return part_one, sequence
 
-            if position in visited:
-                continue
+STEPS = 26501365
 
-            visited.add(position)
 
-            queue.extend((cost + 1, new_pos) for new_pos in self.neighbours(position))
+def parse(text: str) -> Layout:
+    return Layout.from_string(text)
 
-        raise AssertionError
 
+def part_one(layout: Layout) -> int:
+    [count] = layout.reachable([64])
+    return count
 
-def solve() -> None:
-    puzzle = data_dir() / "day21.txt"
-    data = puzzle.read_text(encoding="utf-8")
 
-    layout = Layout.from_string(data)
-    part_one, sequence = layout.solve(64, 26501365)
-    print(f"Part one: {part_one}")
+def part_two(layout: Layout) -> int:
+    n, remainder = divmod(STEPS, layout.num_cols)
+    checkpoints = [remainder + i * layout.num_cols for i in range(3)]
+    sequence = layout.reachable(checkpoints)
 
     diff1 = [j - i for i, j in itertools.pairwise(sequence)]
     diff2 = [j - i for i, j in itertools.pairwise(diff1)]
     a = diff2[0] // 2  # it's an integer, I checked...
     b = diff1[0] - a
     c = sequence[0]
-    n = 26501365 // layout.num_cols
-    part_two = a * n * n + b * n + c
-    print(f"Part two: {part_two}")
+    return a * n * n + b * n + c
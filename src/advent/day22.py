@@ -4,8 +4,6 @@ import itertools
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from advent.utils import data_dir
-
 if TYPE_CHECKING:
     from advent.utils import Coord3
 
@@ -121,34 +119,46 @@ class Tower:
         return above
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day22.txt"
-    data = puzzle.read_text(encoding="utf-8")
+@dataclass(frozen=True)
+class Supports:
+    below: dict[int, set[int]]
+    above: dict[int, set[int]]
+
+    def required(self) -> set[int]:
+        return {b for bs in self.below.values() for b in bs if len(bs) == 1}
+
 
-    bricks = list(itertools.starmap(Brick.from_string, enumerate(data.splitlines())))
+# Bricks only make sense once they have settled, so that is part of parsing.
+def parse(text: str) -> Supports:
+    bricks = list(itertools.starmap(Brick.from_string, enumerate(text.splitlines())))
 
     tower = Tower(bricks)
     tower.settle()
 
     below = {brick.index: tower.supporting_below(brick) for brick in tower.bricks}
     above = {brick.index: tower.supported_above(brick) for brick in tower.bricks}
+    return Supports(below, above)
+
+
+def part_one(supports: Supports) -> int:
+    return len(supports.below) - len(supports.required())
+
 
-    required = {b for bs in below.values() for b in bs if len(bs) == 1}
-    part_one = len(bricks) - len(required)
-    print(f"Part one: {part_one}")
+def part_two(supports: Supports) -> int:
+    below, above = supports.below, supports.above
 
-    part_two = 0
-    for start in required:
+    total = 0
+    for start in supports.required():
         disintegrated: set[int] = set()
         stack = [start]
         while stack:
             brick = stack.pop()
             disintegrated.add(brick)
             for brick_above in above[brick]:
-                supports = below[brick_above]
-                if supports <= disintegrated:
+                supports_above = below[brick_above]
+                if supports_above <= disintegrated:
                     stack.append(brick_above)
 
-        part_two += len(disintegrated) - 1
+        total += len(disintegrated) - 1
 
-    print(f"Part two: {part_two}")
+    return total
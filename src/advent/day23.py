@@ -4,26 +4,25 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from advent.utils import Coord2, data_dir
+from advent.utils import Grid
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 NORTH = (-1, 0)
 SOUTH = (1, 0)
 EAST = (0, 1)
 WEST = (0, -1)
 
-TURNS = {
-    "^": [NORTH],
-    "v": [SOUTH],
-    ">": [EAST],
-    "<": [WEST],
-    ".": [NORTH, SOUTH, EAST, WEST],
+SLOPES = {
+    ord("^"): NORTH,
+    ord("v"): SOUTH,
+    ord(">"): EAST,
+    ord("<"): WEST,
 }
 
-
-type Grid = dict[Coord2, str]
+FOREST = ord("#")
+PATH = ord(".")
 
 
 @dataclass(frozen=True)
@@ -32,34 +31,30 @@ class Layout:
 
     @staticmethod
     def from_string(text: str) -> Layout:
-        grid = {
-            (row, col): char
-            for row, line in enumerate(text.splitlines())
-            for col, char in enumerate(line)
-            if char != "#"
-        }
+        return Layout(Grid.from_string(text))
 
-        return Layout(grid)
+    def tiles(self) -> Iterator[int]:
+        return (index for index in self.grid.indexes() if self.grid[index] != FOREST)
 
-    def neighbours(self, tile: Coord2, *, part_two: bool = False) -> Iterator[Coord2]:
-        row, col = tile
-        content = "." if part_two else self.grid[tile]
-        directions = TURNS[content]
+    def neighbours(self, tile: int, *, part_two: bool = False) -> Iterator[int]:
+        content = PATH if part_two else self.grid[tile]
+        if content == PATH:
+            new_tiles: Iterable[int | None] = self.grid.neighbours(tile)
+        else:
+            new_tiles = [self.grid.step(tile, SLOPES[content])]
 
-        for drow, dcol in directions:
-            new_row = row + drow
-            new_col = col + dcol
-            if (new_row, new_col) not in self.grid:
+        for new_tile in new_tiles:
+            if new_tile is None or self.grid[new_tile] == FOREST:
                 continue
 
-            yield (new_row, new_col)
+            yield new_tile
 
     def direct_paths(
-        self, tiles: set[Coord2], *, part_two: bool = False
-    ) -> dict[Coord2, list[tuple[Coord2, int]]]:
-        paths: dict[Coord2, list[tuple[Coord2, int]]] = defaultdict(list)
+        self, tiles: set[int], *, part_two: bool = False
+    ) -> dict[int, list[tuple[int, int]]]:
+        paths: dict[int, list[tuple[int, int]]] = defaultdict(list)
         for start in tiles:
-            visited: set[Coord2] = set()
+            visited: set[int] = set()
             stack = [(0, start)]
             while stack:
                 distance, tile = stack.pop()
@@ -80,11 +75,11 @@ class Layout:
         return paths
 
     def solve(self, *, part_two: bool = False) -> int:
-        goal = max(self.grid)
-        start = min(self.grid)
+        start = self.grid.cells.find(PATH)
+        goal = self.grid.cells.rfind(PATH)
         hubs = {
             tile
-            for tile in self.grid
+            for tile in self.tiles()
             if sum(1 for n in self.neighbours(tile, part_two=part_two)) > 2
         }
         nodes = hubs | {start, goal}
@@ -92,7 +87,7 @@ class Layout:
 
         neighbours = self.direct_paths(nodes, part_two=part_two)
 
-        tile_values: dict[Coord2, int] = {}
+        tile_values: dict[int, int] = {}
         for tile, paths in neighbours.items():
             paths.sort(key=lambda x: x[1])
             weights = [w for _, w in paths]
@@ -101,7 +96,7 @@ class Layout:
 
         bound = sum(tile_values.values())
         best = 0
-        stack: list[tuple[int, int, int, int, Coord2]] = [(0, bound, 0, 0, start)]
+        stack: list[tuple[int, int, int, int, int]] = [(0, bound, 0, 0, start)]
 
         while stack:
             cost, bound, in_cost, path, tile = stack.pop()
@@ -127,13 +122,13 @@ class Layout:
         return best
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day23.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> Layout:
+    return Layout.from_string(text)
+
+
+def part_one(layout: Layout) -> int:
+    return layout.solve()
 
-    layout = Layout.from_string(data)
-    part_one = layout.solve()
-    print(f"Part one: {part_one}")
 
-    part_two = layout.solve(part_two=True)
-    print(f"Part two: {part_two}")
+def part_two(layout: Layout) -> int:
+    return layout.solve(part_two=True)
@@ -6,29 +6,30 @@ from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ortools.sat.python import cp_model
-
-from advent.utils import Coord2, data_dir
+from advent.api import read_input
+from advent.utils import Grid
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+
+    from ortools.sat.python import cp_model
 
 NORTH = (-1, 0)
 SOUTH = (1, 0)
 EAST = (0, 1)
 WEST = (0, -1)
 
-TURNS = {
-    "^": [NORTH],
-    "v": [SOUTH],
-    ">": [EAST],
-    "<": [WEST],
-    ".": [NORTH, SOUTH, EAST, WEST],
+SLOPES = {
+    ord("^"): NORTH,
+    ord("v"): SOUTH,
+    ord(">"): EAST,
+    ord("<"): WEST,
 }
 
+FOREST = ord("#")
+PATH = ord(".")
 
-type Grid = dict[Coord2, str]
-type Edge = tuple[Coord2, Coord2]
+type Edge = tuple[int, int]
 
 
 @dataclass(frozen=True)
@@ -37,34 +38,30 @@ class Layout:
 
     @staticmethod
     def from_string(text: str) -> Layout:
-        grid = {
-            (row, col): char
-            for row, line in enumerate(text.splitlines())
-            for col, char in enumerate(line)
-            if char != "#"
-        }
+        return Layout(Grid.from_string(text))
 
-        return Layout(grid)
+    def tiles(self) -> Iterator[int]:
+        return (index for index in self.grid.indexes() if self.grid[index] != FOREST)
 
-    def neighbours(self, tile: Coord2, *, part_two: bool = False) -> Iterator[Coord2]:
-        row, col = tile
-        content = "." if part_two else self.grid[tile]
-        directions = TURNS[content]
+    def neighbours(self, tile: int, *, part_two: bool = False) -> Iterator[int]:
+        content = PATH if part_two else self.grid[tile]
+        if content == PATH:
+            new_tiles: Iterable[int | None] = self.grid.neighbours(tile)
+        else:
+            new_tiles = [self.grid.step(tile, SLOPES[content])]
 
-        for drow, dcol in directions:
-            new_row = row + drow
-            new_col = col + dcol
-            if (new_row, new_col) not in self.grid:
+        for new_tile in new_tiles:
+            if new_tile is None or self.grid[new_tile] == FOREST:
                 continue
 
-            yield (new_row, new_col)
+            yield new_tile
 
     def direct_edges(
-        self, tiles: set[Coord2], *, part_two: bool = False
+        self, tiles: set[int], *, part_two: bool = False
     ) -> dict[Edge, int]:
         edges: dict[Edge, int] = {}
         for start in tiles:
-            visited: set[Coord2] = set()
+            visited: set[int] = set()
             queue = deque([(0, start)])
             while queue:
                 distance, tile = queue.popleft()
@@ -85,11 +82,14 @@ class Layout:
         return edges
 
     def solve(self, *, part_two: bool = False) -> int:
-        goal = max(self.grid)
-        start = min(self.grid)
+        # CP-SAT is expensive to import, so wait until we actually need it.
+        from ortools.sat.python import cp_model
+
+        start = self.grid.cells.find(PATH)
+        goal = self.grid.cells.rfind(PATH)
         hubs = {
             tile
-            for tile in self.grid
+            for tile in self.tiles()
             if sum(1 for n in self.neighbours(tile, part_two=part_two)) > 2
         }
         nodes = hubs | {start, goal}
@@ -123,17 +123,19 @@ class Layout:
         return int(value)
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day23.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> Layout:
+    return Layout.from_string(text)
+
+
+def part_one(layout: Layout) -> int:
+    return layout.solve()
 
-    layout = Layout.from_string(data)
-    part_one = layout.solve()
-    print(f"Part one: {part_one}")
 
-    part_two = layout.solve(part_two=True)
-    print(f"Part two: {part_two}")
+def part_two(layout: Layout) -> int:
+    return layout.solve(part_two=True)
 
 
 if __name__ == "__main__":
-    solve()
+    layout = parse(read_input(23))
+    print(f"Part one: {part_one(layout)}")
+    print(f"Part two: {part_two(layout)}")
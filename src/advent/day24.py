@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-import itertools
 import math
 from dataclasses import dataclass
 
-from advent.utils import Vec3, data_dir
+import numpy as np
+
+from advent.utils import Vec3
+
+LOWER = 200000000000000
+UPPER = 400000000000000
+
+# Stones to pair up at a time in part one.
+BLOCK = 256
 
 
 @dataclass
@@ -23,35 +30,51 @@ class Stone:
         return Stone(self.pos - other.pos, self.vel - other.vel)
 
 
-def cross_part_one(s1: Stone, s2: Stone) -> bool:
-    # First line is s1 + t1 * v1
-    # Second line is s2 + t2 * v2
+def cross_part_one(stones: list[Stone]) -> int:
+    # First line is p1 + t1 * v1
+    # Second line is p2 + t2 * v2
     #
-    # Find when and where they meet.
+    # Find when and where they meet, in x and y only.
     #
-    # s2 - s1 = t1 * v1 - t2 * v2
-    det = s1.vel.cross(s2.vel).z
-    if det == 0:
-        return False
-
-    s = s2 - s1
-    t1 = s.pos.cross(s2.vel).z / det
-    if t1 < 0:
-        return False
-
-    t2 = s.pos.cross(s1.vel).z / det
-    if t2 < 0:
-        return False
-
-    x = s1.pos.x + t1 * s1.vel.x
-    if not 200000000000000 <= x <= 400000000000000:
-        return False
-
-    y = s1.pos.y + t1 * s1.vel.y
-    if not 200000000000000 <= y <= 400000000000000:  # noqa: SIM103
-        return False
-
-    return True
+    # p2 - p1 = t1 * v1 - t2 * v2
+    #
+    # A block of first stones at a time against all the later ones: so that memory
+    # grows with the number of stones, not its square.
+    px, py, vx, vy = np.array(
+        [(s.pos.x, s.pos.y, s.vel.x, s.vel.y) for s in stones], dtype=np.int64
+    ).T
+
+    count = 0
+    for lo in range(0, len(stones), BLOCK):
+        hi = min(lo + BLOCK, len(stones))
+        p1x, p1y = px[lo:hi, None], py[lo:hi, None]
+        v1x, v1y = vx[lo:hi, None], vy[lo:hi, None]
+        p2x, p2y = px[None, lo:], py[None, lo:]
+        v2x, v2y = vx[None, lo:], vy[None, lo:]
+
+        # The z components of v1 x v2, (p2 - p1) x v2, and (p2 - p1) x v1.
+        det = v1x * v2y - v2x * v1y
+        sx = p2x - p1x
+        sy = p2y - p1y
+        n1 = sx * v2y - v2x * sy
+        n2 = sx * v1y - v1x * sy
+
+        # Parallel paths never meet: divide by anything but zero, and discard them.
+        parallel = det == 0
+        det[parallel] = 1
+        t1 = n1 / det
+        t2 = n2 / det
+
+        x = p1x + t1 * v1x
+        y = p1y + t1 * v1y
+        ok = ~parallel & (t1 >= 0) & (t2 >= 0)
+        ok &= (x >= LOWER) & (x <= UPPER)
+        ok &= (y >= LOWER) & (y <= UPPER)
+
+        # Only pairs with the second stone later than the first.
+        count += int(np.triu(ok, 1).sum())
+
+    return count
 
 
 def collide_part_two(stones: list[Stone]) -> int:
@@ -86,14 +109,13 @@ def collide_part_two(stones: list[Stone]) -> int:
     return rpos.x + rpos.y + rpos.z
 
 
-def solve() -> None:
-    puzzle = data_dir() / "day24.txt"
-    data = puzzle.read_text(encoding="utf-8")
+def parse(text: str) -> list[Stone]:
+    return [Stone.from_string(line) for line in text.splitlines()]
+
 
-    stones = [Stone.from_string(line) for line in data.splitlines()]
+def part_one(stones: list[Stone]) -> int:
+    return cross_part_one(stones)
 
-    part_one = sum(itertools.starmap(cross_part_one, itertools.combinations(stones, 2)))
-    print(f"Part one: {part_one}")
 
-    part_two = collide_part_two(stones)
-    print(f"Part two: {part_two}")
+def part_two(stones: list[Stone]) -> int:
+    return collide_part_two(stones)
@@ -4,48 +4,49 @@ import math
 import random
 from collections import Counter
 
-from advent.utils import UnionFind, data_dir
+from advent.utils import ArrayUnionFind
 
 type Node = str
 type Edge = tuple[Node, Node]
+type IndexedEdge = tuple[int, int]
 
 
-def karger(nodes: set[Node], edges: list[Edge]) -> tuple[UnionFind[Node], list[Edge]]:
-    uf = UnionFind.from_elements(nodes)
+def karger(uf: ArrayUnionFind[Node], edges: list[IndexedEdge]) -> list[IndexedEdge]:
+    # Trials reuse the same union-find, and the same edges, rather than building anew.
+    uf.reset()
     random.shuffle(edges)
 
     edge_iter = iter(edges)
-    components = len(nodes)
+    components = len(uf)
     while components > 2:
         edge = next(edge_iter)
         if uf.union(*edge):
             components -= 1
 
-    cut = [(a, b) for a, b in edge_iter if uf.find(a) != uf.find(b)]
+    return [(a, b) for a, b in edge_iter if uf.find(a) != uf.find(b)]
 
-    return uf, cut
-
-
-def solve() -> None:
-    puzzle = data_dir() / "day25.txt"
-    data = puzzle.read_text(encoding="utf-8")
 
+def parse(text: str) -> tuple[set[Node], list[Edge]]:
     nodes: set[Node] = set()
     edges: list[Edge] = []
 
-    for line in data.splitlines():
+    for line in text.splitlines():
         node, neighbours = line.split(": ")
         nodes.add(node)
         for neighbour in neighbours.split():
             nodes.add(neighbour)
             edges.append((node, neighbour))
 
-    while True:
-        uf, cut = karger(nodes, edges)
-        if len(cut) == 3:
-            break
+    return nodes, edges
+
+
+def part_one(graph: tuple[set[Node], list[Edge]]) -> int:
+    nodes, edges = graph
+    uf = ArrayUnionFind.from_elements(nodes)
+    indexed = [(uf.index(a), uf.index(b)) for a, b in edges]
 
-    counter = Counter(uf.find(node) for node in nodes)
+    while len(karger(uf, indexed)) != 3:
+        pass
 
-    part_one = math.prod(counter.values())
-    print(f"Part one: {part_one}")
+    counter = Counter(uf.find(i) for i in range(len(uf)))
+    return math.prod(counter.values())
@@ -0,0 +1,582 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import string
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Each generator makes a valid puzzle input of roughly the given size: n lines, n items,
+# or an n x n grid.  Inputs are valid in that the solvers' assumptions about them hold,
+# not in that they are the same as the real thing in every respect.
+type Generator = Callable[[random.Random, int], str]
+
+GENERATORS: dict[int, Generator] = {}
+
+DIGIT_WORDS = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    def register(function: Generator) -> Generator:
+        GENERATORS[day] = function
+        return function
+
+    return register
+
+
+def grid(rows: list[list[str]]) -> str:
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+def names(
+    rng: random.Random, count: int, *, avoid: set[str] | None = None
+) -> list[str]:
+    # Distinct, short, lower case names.
+    avoid = avoid or set()
+    length = 3
+    while 26**length < 2 * (count + len(avoid)):
+        length += 1
+
+    found: set[str] = set()
+    while len(found) < count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=length))
+        if name not in avoid:
+            found.add(name)
+
+    return sorted(found, key=lambda _: rng.random())
+
+
+@generator(1)
+def calibration(rng: random.Random, n: int) -> str:
+    lines: list[str] = []
+    for _ in range(n):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            choice = rng.random()
+            if choice < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif choice < 0.6:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                length = rng.randint(1, 5)
+                pieces.append("".join(rng.choices(string.ascii_lowercase, k=length)))
+
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(2)
+def cubes(rng: random.Random, n: int) -> str:
+    lines: list[str] = []
+    for game in range(1, n + 1):
+        rounds: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+
+        lines.append(f"Game {game}: {'; '.join(rounds)}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(3)
+def schematic(rng: random.Random, n: int) -> str:
+    rows: list[list[str]] = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < n:
+            choice = rng.random()
+            if choice < 0.15 and (not row or not row[-1].isdigit()):
+                digits = str(rng.randint(1, 999))
+                row.extend(digits[: n - len(row)])
+            elif choice < 0.2:
+                row.append(rng.choice("*#+$/@%=-&"))
+            else:
+                row.append(".")
+
+        rows.append(row)
+
+    return grid(rows)
+
+
+@generator(4)
+def scratchcards(rng: random.Random, n: int) -> str:
+    width = len(str(n))
+    lines: list[str] = []
+    for card in range(1, n + 1):
+        # Cards never win copies of cards past the end of the table.
+        matches = min(rng.choice([0, 0, 0, 1, 2, 3, 5, 10]), n - card)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winners = numbers[:10]
+        mine = winners[:matches] + numbers[10:]
+        rng.shuffle(mine)
+        ws = " ".join(f"{w:>2}" for w in winners)
+        ms = " ".join(f"{m:>2}" for m in mine)
+        lines.append(f"Card {card:>{width}}: {ws} | {ms}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(5)
+def almanac(rng: random.Random, n: int) -> str:
+    # Seed ranges, and n ranges in each map.
+    top = 1 << 32
+    seeds = itertools.chain.from_iterable(
+        (start, rng.randint(1, top // (2 * n)))
+        for start in rng.sample(range(top // 2), n)
+    )
+    lines = [f"seeds: {' '.join(str(s) for s in seeds)}"]
+
+    stages = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    stages += ["humidity", "location"]
+    for source, dest in itertools.pairwise(stages):
+        lines += ["", f"{source}-to-{dest} map:"]
+        bounds = sorted(rng.sample(range(1, top), n))
+        for lo, hi in itertools.pairwise([0, *bounds]):
+            lines.append(f"{rng.randrange(top - (hi - lo))} {lo} {hi - lo}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(6)
+def races(rng: random.Random, n: int) -> str:
+    times = [rng.randint(7, 99) for _ in range(n)]
+    records = [rng.randrange(t * t // 4) for t in times]
+    return (
+        f"Time:     {' '.join(f'{t:>4}' for t in times)}\n"
+        f"Distance: {' '.join(f'{r:>4}' for r in records)}\n"
+    )
+
+
+@generator(7)
+def camel_cards(rng: random.Random, n: int) -> str:
+    lines = [
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}"
+        for _ in range(n)
+    ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(8)
+def network(rng: random.Random, n: int) -> str:
+    # Each ghost runs round a cycle that ends on a Z, so that its first arrival at a Z
+    # is also the length of its cycle.  Names have three letters, which caps the size.
+    n = min(n, 15000)
+    ghosts = max(1, min(6, n // 100))
+    lengths = [max(2, n // ghosts + rng.randint(-10, 10)) for _ in range(ghosts)]
+
+    letters = string.ascii_uppercase
+    middles = ["".join(p) for p in itertools.product(letters, repeat=2)]
+    middles = [m for m in middles if m not in ("AA", "ZZ")]
+    starts = ["AAA"] + [f"{m}A" for m in rng.sample(middles, ghosts - 1)]
+    ends = ["ZZZ"] + [f"{m}Z" for m in rng.sample(middles, ghosts - 1)]
+    others = [
+        "".join(p) for p in itertools.product(letters, repeat=3) if p[-1] not in "AZ"
+    ]
+    pool = iter(rng.sample(others, sum(lengths)))
+
+    nodes: list[tuple[str, str]] = []
+    for start, end, length in zip(starts, ends, lengths, strict=True):
+        path = [start] + [next(pool) for _ in range(length - 1)] + [end]
+        nodes.extend(itertools.pairwise(path))
+        nodes.append((end, path[1]))
+
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    lines = [instructions, ""]
+    lines += [f"{name} = ({after}, {after})" for name, after in nodes]
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(9)
+def sequences(rng: random.Random, n: int) -> str:
+    lines: list[str] = []
+    for _ in range(n):
+        degree = rng.randint(1, 8)
+        coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+        values = [sum(c * x**k for k, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(str(v) for v in values))
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+PIPES = {
+    ((0, 1), (0, 1)): "-",
+    ((0, -1), (0, -1)): "-",
+    ((1, 0), (1, 0)): "|",
+    ((-1, 0), (-1, 0)): "|",
+    ((0, 1), (-1, 0)): "J",
+    ((1, 0), (0, -1)): "J",
+    ((0, 1), (1, 0)): "7",
+    ((-1, 0), (0, -1)): "7",
+    ((-1, 0), (0, 1)): "F",
+    ((0, -1), (1, 0)): "F",
+    ((1, 0), (0, 1)): "L",
+    ((0, -1), (-1, 0)): "L",
+}
+
+
+@generator(10)
+def pipes(rng: random.Random, n: int) -> str:
+    # The loop runs along the bottom, up the right, back along a ragged top, and down
+    # the left.
+    n = max(n, 6)
+    bottom = n - 2
+    tops = [1] * n
+    for col in range(1, n - 1):
+        tops[col] = max(1, min(n - 4, tops[col - 1] + rng.randint(-2, 2)))
+
+    loop = [(bottom, col) for col in range(1, n - 1)]
+    loop += [(row, n - 2) for row in range(bottom - 1, tops[n - 2] - 1, -1)]
+    for col in range(n - 2, 2, -1):
+        loop.append((tops[col], col - 1))
+        step = 1 if tops[col - 1] > tops[col] else -1
+        loop += [
+            (row, col - 1)
+            for row in range(tops[col] + step, tops[col - 1] + step, step)
+        ]
+    loop.append((tops[2], 1))
+    loop += [(row, 1) for row in range(tops[2] + 1, bottom)]
+
+    rows = [rng.choices("|-LJ7F.......", k=n) for _ in range(n)]
+    for i, (row, col) in enumerate(loop):
+        before = loop[i - 1]
+        after = loop[(i + 1) % len(loop)]
+        going_in = (row - before[0], col - before[1])
+        going_out = (after[0] - row, after[1] - col)
+        rows[row][col] = PIPES[going_in, going_out]
+
+    # Start on the bottom edge, with nothing else joining it.
+    col = rng.randint(2, n - 3)
+    rows[bottom][col] = "S"
+    rows[bottom - 1][col] = "."
+    rows[bottom + 1][col] = "."
+    return grid(rows)
+
+
+@generator(11)
+def galaxies(rng: random.Random, n: int) -> str:
+    empty_rows = set(rng.sample(range(n), n // 20))
+    empty_cols = set(rng.sample(range(n), n // 20))
+    rows = [
+        [
+            "#"
+            if r not in empty_rows and c not in empty_cols and rng.random() < 0.02
+            else "."
+            for c in range(n)
+        ]
+        for r in range(n)
+    ]
+    return grid(rows)
+
+
+@generator(12)
+def springs(rng: random.Random, n: int) -> str:
+    lines: list[str] = []
+    while len(lines) < n:
+        pattern = "".join(rng.choices("#.", k=rng.randint(6, 20)))
+        groups = [len(g) for g in pattern.split(".") if g]
+        if not groups:
+            continue
+
+        masked = "".join("?" if rng.random() < 0.5 else s for s in pattern)
+        lines.append(f"{masked} {','.join(str(g) for g in groups)}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(13)
+def mirrors(rng: random.Random, n: int) -> str:
+    # Rows reflect exactly, just below the top.  Columns reflect too, but for a smudge
+    # further down.
+    patterns: list[str] = []
+    for _ in range(n):
+        height = rng.randint(7, 17)
+        width = rng.randint(5, 17)
+        row_mirror = rng.randint(1, (height - 3) // 2)
+        col_mirror = rng.randint(1, width - 1)
+        reach = min(col_mirror, width - col_mirror)
+
+        rows: list[list[str]] = []
+        for _ in range(height):
+            row = rng.choices("#.", k=width)
+            for i in range(reach):
+                row[col_mirror + i] = row[col_mirror - i - 1]
+
+            rows.append(row)
+
+        for i in range(row_mirror):
+            rows[row_mirror + i] = rows[row_mirror - i - 1].copy()
+
+        smudge_row = rng.randint(2 * row_mirror, height - 1)
+        smudge_col = rng.randint(col_mirror - reach, col_mirror + reach - 1)
+        smudged = rows[smudge_row]
+        smudged[smudge_col] = "#" if smudged[smudge_col] == "." else "."
+        patterns.append(grid(rows))
+
+    return "\n".join(patterns)
+
+
+@generator(14)
+def dish(rng: random.Random, n: int) -> str:
+    rows = [rng.choices("O#.", weights=[2, 1, 7], k=n) for _ in range(n)]
+    return grid(rows)
+
+
+@generator(15)
+def initialization(rng: random.Random, n: int) -> str:
+    labels = names(rng, max(1, n // 4))
+    steps = [
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-"
+        for label in rng.choices(labels, k=n)
+    ]
+    return ",".join(steps) + "\n"
+
+
+@generator(16)
+def contraption(rng: random.Random, n: int) -> str:
+    rows = [rng.choices("./\\|-", weights=[90, 3, 3, 2, 2], k=n) for _ in range(n)]
+    return grid(rows)
+
+
+@generator(17)
+def city(rng: random.Random, n: int) -> str:
+    rows = [rng.choices("123456789", k=n) for _ in range(n)]
+    return grid(rows)
+
+
+def skyline(rng: random.Random, columns: int, biggest: int) -> list[tuple[int, int]]:
+    # A simple polygon: up and across a ragged top, then back down and along the bottom.
+    moves: list[tuple[int, int]] = []  # (direction, distance), with "RDLU"[direction]
+    height = rng.randint(1, biggest)
+    width = 0
+    moves.append((3, height))
+    for column in range(columns):
+        if column > 0:
+            new_height = height
+            while new_height == height:
+                new_height = rng.randint(1, biggest)
+
+            rise = new_height - height
+            moves.append((3, rise) if rise > 0 else (1, -rise))
+            height = new_height
+
+        step = rng.randint(1, biggest)
+        moves.append((0, step))
+        width += step
+
+    moves += [(1, height), (2, width)]
+    return moves
+
+
+@generator(18)
+def lagoon(rng: random.Random, n: int) -> str:
+    columns = max(1, (n - 2) // 2)
+    small = skyline(rng, columns, 10)
+    large = skyline(rng, columns, 0xFFFFF)
+    lines = [
+        f"{'RDLU'[d1]} {s1} (#{s2:05x}{d2})"
+        for (d1, s1), (d2, s2) in zip(small, large, strict=True)
+    ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(19)
+def workflows(rng: random.Random, n: int) -> str:
+    # Workflows form a tree, so that every part ends up accepted or rejected.
+    flow_names = ["in", *names(rng, n, avoid={"in"})]
+    unused = iter(flow_names[1:])
+    lines: list[str] = []
+    pending = ["in"]
+    while pending:
+        name = pending.pop()
+        rules: list[str] = []
+        for i in range(rng.randint(2, 4)):
+            target = next(unused, None) if rng.random() < 0.5 else None
+            if target is None:
+                target = rng.choice("AR")
+            else:
+                pending.append(target)
+
+            if i == 0:
+                rules.append(target)
+            else:
+                category = rng.choice("xmas")
+                rules.append(
+                    f"{category}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+                )
+
+        lines.append(f"{name}{{{','.join(reversed(rules))}}}")
+
+    lines.append("")
+    for _ in range(n):
+        values = ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas")
+        lines.append(f"{{{values}}}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(21)
+def garden(rng: random.Random, n: int) -> str:
+    # Part two leans on the shape of the real input: an odd-sized square, start in the
+    # middle, and clear paths straight out from it, round the edge, and along the
+    # diamond between.
+    n = max(n, 5) | 1
+    middle = n // 2
+    rows = [rng.choices("#.", weights=[1, 6], k=n) for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            clear = middle in (i, j) or i in (0, n - 1) or j in (0, n - 1)
+            clear = clear or abs(i - middle) + abs(j - middle) == middle
+            if clear:
+                rows[i][j] = "."
+
+    rows[middle][middle] = "S"
+    return grid(rows)
+
+
+@generator(22)
+def bricks(rng: random.Random, n: int) -> str:
+    occupied: set[tuple[int, int, int]] = set()
+    lines: list[str] = []
+    while len(lines) < n:
+        axis = rng.randrange(3)
+        length = rng.randint(1, 4)
+        lo = [rng.randrange(10), rng.randrange(10), rng.randint(1, n)]
+        hi = lo.copy()
+        hi[axis] += length - 1
+        if hi[0] >= 10 or hi[1] >= 10:
+            continue
+
+        cubes = {
+            (x, y, z)
+            for x in range(lo[0], hi[0] + 1)
+            for y in range(lo[1], hi[1] + 1)
+            for z in range(lo[2], hi[2] + 1)
+        }
+        if cubes & occupied:
+            continue
+
+        occupied |= cubes
+        lines.append(f"{lo[0]},{lo[1]},{lo[2]}~{hi[0]},{hi[1]},{hi[2]}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def corridor(length: int, slope: str) -> list[str]:
+    # From one junction to the next, with slopes just outside each.
+    middle = [slope] if length == 3 else [slope, *["."] * (length - 4), slope]
+    return [".", *middle, "."]
+
+
+@generator(23)
+def trails(rng: random.Random, n: int) -> str:
+    # Junctions on a lattice, joined by corridors that slope away from the start.  The
+    # real input has a six by six lattice, and part two scales badly beyond that.
+    n = max(n, 11)
+    count = min(6, (n - 3) // 4)
+    junction_rows = sorted(rng.sample(range(2, n - 2, 2), count))
+    junction_cols = sorted(rng.sample(range(2, n - 2, 2), count))
+
+    rows = [["#"] * n for _ in range(n)]
+    for r in junction_rows:
+        for a, b in itertools.pairwise(junction_cols):
+            rows[r][a : b + 1] = corridor(b - a + 1, ">")
+
+    for c in junction_cols:
+        for a, b in itertools.pairwise(junction_rows):
+            for r, tile in zip(range(a, b + 1), corridor(b - a + 1, "v"), strict=True):
+                rows[r][c] = tile
+
+    for r in range(junction_rows[0]):
+        rows[r][junction_cols[0]] = "."
+
+    for r in range(junction_rows[-1], n):
+        rows[r][junction_cols[-1]] = "."
+
+    return grid(rows)
+
+
+@generator(24)
+def hailstones(rng: random.Random, n: int) -> str:
+    # Work backwards from a rock that hits every hailstone, at distinct times.
+    rock = [rng.randint(200_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    velocity = [rng.randint(-300, 300) for _ in range(3)]
+
+    lines: list[str] = []
+    for t in rng.sample(range(10**9, 10**12), n):
+        vel = velocity
+        while vel == velocity:
+            vel = [v + rng.randint(-300, 300) for v in velocity]
+
+        pos = [p + t * (v - w) for p, v, w in zip(rock, velocity, vel, strict=True)]
+        positions = ", ".join(str(p) for p in pos)
+        velocities = ", ".join(str(v) for v in vel)
+        lines.append(f"{positions} @ {velocities}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+@generator(25)
+def wiring(rng: random.Random, n: int) -> str:
+    # Two well-connected halves, and exactly three wires between them.
+    n = max(n, 12)
+    nodes = names(rng, n)
+    halves = [nodes[: n // 2], nodes[n // 2 :]]
+
+    edges: set[tuple[str, str]] = set()
+    for half in halves:
+        # Each node joins several earlier ones, so that no small cut separates it.
+        for i in range(1, len(half)):
+            for j in rng.sample(range(i), min(i, 5)):
+                edges.add((half[i], half[j]))
+
+    for a, b in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3), strict=True):
+        edges.add((a, b))
+
+    neighbours: dict[str, list[str]] = {}
+    for a, b in edges:
+        neighbours.setdefault(a, []).append(b)
+
+    lines = [f"{node}: {' '.join(others)}" for node, others in neighbours.items()]
+    rng.shuffle(lines)
+    return "".join(f"{line}\n" for line in lines)
+
+
+def generate(day: int, scale: int, *, seed: int = 0) -> str:
+    function = GENERATORS.get(day)
+    if function is None:
+        msg = f"No generator for day {day}"
+        raise KeyError(msg)
+
+    rng = random.Random(f"{day}:{seed}")  # noqa: S311
+    return function(rng, scale)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="advent generate")
+    parser.add_argument(
+        "day", type=int, choices=sorted(GENERATORS), help="day to generate"
+    )
+    parser.add_argument(
+        "-n", "--scale", type=int, default=100, help="size of input (default: 100)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    print(generate(args.day, args.scale, seed=args.seed), end="")
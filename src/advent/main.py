@@ -1,28 +1,137 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import importlib
+import argparse
+import contextlib
+import functools
+import io
 import sys
+from pathlib import Path
 
+from advent import api
+from advent.api import DAYS
+from advent.cache import AnswerCache, cache_dir
 
-def solve(day: int) -> None:
+
+def solve(day: int, *, cached: bool = True) -> None:
     try:
-        module = importlib.import_module(f"advent.day{day:02}")
-        module.solve()
+        text = api.read_input(day)
+        if cached:
+            answers = AnswerCache(cache_dir()).run(day, text)
+        else:
+            answers = api.run(day, text)
     except ModuleNotFoundError:
         print(f"Day {day} not implemented")
+        return
 
+    show(answers)
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        for day in range(1, 26):
+
+def show(answers: api.Answers) -> None:
+    print(f"Part one: {answers.part_one}")
+    if answers.part_two is not None:
+        print(f"Part two: {answers.part_two}")
+
+
+def capture(day: int, *, cached: bool = True) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        solve(day, cached=cached)
+
+    return output.getvalue()
+
+
+def solve_all(jobs: int | None, *, cached: bool = True) -> None:
+    # Imported here, so that solving a single day need not pay for it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Days are independent, so farm them out - but report in order.
+    task = functools.partial(capture, cached=cached)
+    with ProcessPoolExecutor(jobs) as executor:
+        for day, output in zip(DAYS, executor.map(task, DAYS), strict=True):
             print(f"Day {day}:")
-            solve(day)
-            print()
+            print(output)
+
+
+def main() -> None:
+    # Subcommands and rarely used options import what they need only when asked: every
+    # run of the command line would otherwise pay for them.
+    if sys.argv[1:2] == ["bench"]:
+        from advent import bench
+
+        bench.main(sys.argv[2:])
+        return
+
+    if sys.argv[1:2] == ["generate"]:
+        from advent import generate
+
+        generate.main(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(prog="advent")
+    parser.add_argument("day", type=int, nargs="?", help="solve just this day")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        help="solve days in parallel, using this many processes (default: all cpus)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cached",
+        action="store_false",
+        help="always solve, rather than using previously cached answers",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="report how long it takes to import each day, rather than solving",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="profile the day, writing collapsed stacks to PATH if it ends .folded, "
+        "else pstats",
+    )
+    parser.add_argument(
+        "--trace-alloc",
+        action="store_true",
+        help="report peak memory and the top allocation sites for the day",
+    )
+    args = parser.parse_args()
+
+    if args.startup_report:
+        from advent import startup
+
+        startup.report(DAYS if args.day is None else [args.day])
+
+    elif args.profile is not None or args.trace_alloc:
+        if args.day is None:
+            parser.error("--profile and --trace-alloc need a day")
+
+        from advent import profiling
+
+        if args.profile is not None:
+            show(profiling.profile(args.day, args.profile))
+            print(f"Profile written to {args.profile}")
+
+        if args.trace_alloc:
+            show(profiling.trace_allocations(args.day))
+
+    elif args.day is not None:
+        solve(args.day, cached=args.cached)
+
+    elif args.jobs is not None:
+        solve_all(args.jobs or None, cached=args.cached)
 
     else:
-        day = int(sys.argv[1])
-        solve(day)
+        for day in DAYS:
+            print(f"Day {day}:")
+            solve(day, cached=args.cached)
+            print()
 
 
 if __name__ == "__main__":
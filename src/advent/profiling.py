@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import cProfile
+import fnmatch
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from advent import api
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType, TracebackType
+
+PARTS = {"part one": "part_one", "part two": "part_two"}
+
+T = TypeVar("T")
+
+# Allocations by the tracing itself, including those made by filtering: which matches
+# filenames with fnmatch, and so compiles regular expressions.
+IGNORED = [
+    __file__,
+    threading.__file__,
+    tracemalloc.__file__,
+    fnmatch.__file__,
+    str(Path(re.__file__).parent / "*"),
+]
+
+
+class Collapser:
+    # Records time spent in each distinct call stack.
+    #
+    # Output is in the "collapsed" format understood by flamegraph tools: one line per
+    # stack, frames separated by semicolons, followed by a count of microseconds.
+
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.totals: Counter[str] = Counter()
+        self.last = time.perf_counter_ns()
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        now = time.perf_counter_ns()
+        if self.stack:
+            self.totals[self.stack[-1]] += now - self.last
+
+        if event in ("call", "c_call"):
+            if event == "call":
+                module = frame.f_globals.get("__name__", "?")
+                name = f"{module}.{frame.f_code.co_qualname}"
+            else:
+                module = getattr(arg, "__module__", None) or "builtins"
+                name = f"{module}.{getattr(arg, '__qualname__', '?')}"
+
+            self.stack.append(f"{self.stack[-1]};{name}" if self.stack else name)
+
+        elif self.stack:
+            self.stack.pop()
+
+        self.last = time.perf_counter_ns()
+
+    def runcall(self, function: Callable[..., T], *args: Any) -> T:
+        sys.setprofile(self)
+        try:
+            return function(*args)
+        finally:
+            sys.setprofile(None)
+
+    def dump_stats(self, path: Path) -> None:
+        lines = (
+            f"{stack} {nanos // 1000}\n"
+            for stack, nanos in self.totals.items()
+            if nanos >= 1000
+        )
+        path.write_text("".join(lines), encoding="utf-8")
+
+
+def profile(day: int, path: Path) -> api.Answers:
+    text = api.read_input(day)
+    profiler = Collapser() if path.suffix == ".folded" else cProfile.Profile()
+    answers = profiler.runcall(api.run, day, text)
+    profiler.dump_stats(path)
+    return answers
+
+
+class PeakSnapshot:
+    # Snapshots traced memory every so often, keeping the snapshot with the most memory.
+    #
+    # tracemalloc knows the peak size but not what was allocated at the time, so this is
+    # how we find out what is responsible for memory that is freed before the end.
+    #
+    # It is only a sample: the true peak may fall between snapshots.
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.size = -1
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+
+    def take(self) -> None:
+        size, _ = tracemalloc.get_traced_memory()
+        if size > self.size:
+            self.size = size
+            snapshot = tracemalloc.take_snapshot()
+            filters = [
+                tracemalloc.Filter(inclusive=False, filename_pattern=f) for f in IGNORED
+            ]
+            self.snapshot = snapshot.filter_traces(filters)
+
+    def watch(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.take()
+
+    def __enter__(self) -> Self:
+        self.thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stopped.set()
+        self.thread.join()
+        self.take()
+
+
+def mebibytes(size: int) -> str:
+    return f"{size / (1024 * 1024):8.2f}MiB"
+
+
+def trace_allocations(day: int, *, top: int = 10) -> api.Answers:
+    # Import before tracing, so that only the solution itself is measured.
+    module = api.load(day)
+    text = api.read_input(day)
+
+    answers: dict[str, int] = {}
+    tracemalloc.start()
+    try:
+        phases = [("parse", module.parse)]
+        phases += [
+            (phase, getattr(module, name))
+            for phase, name in PARTS.items()
+            if hasattr(module, name)
+        ]
+
+        parsed = text
+        for phase, function in phases:
+            tracemalloc.reset_peak()
+            with PeakSnapshot() as peak:
+                result = function(parsed)
+            _, peak_size = tracemalloc.get_traced_memory()
+
+            if phase == "parse":
+                parsed = result
+            else:
+                answers[phase] = result
+
+            print(f"{phase}: peak {mebibytes(peak_size).strip()}")
+            assert peak.snapshot is not None
+            sampled = mebibytes(peak.size).strip()
+            print(f"  top sites in the largest sampled snapshot, of {sampled}:")
+            for stat in peak.snapshot.statistics("lineno")[:top]:
+                frame = stat.traceback[0]
+                location = f"{frame.filename}:{frame.lineno}"
+                print(f"  {mebibytes(stat.size)}  {stat.count:>9} blocks  {location}")
+            print()
+    finally:
+        tracemalloc.stop()
+
+    return api.Answers(answers["part one"], answers.get("part two"))
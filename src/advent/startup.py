@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    own: int  # microseconds
+    cumulative: int  # microseconds
+    depth: int
+    name: str
+
+    @staticmethod
+    def from_string(line: str) -> ImportTime:
+        # import time:       416 |       2137 |       re._compiler
+        own, cumulative, package = line.removeprefix("import time:").split("|")
+        name = package[1:]
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped)) // 2
+        return ImportTime(int(own), int(cumulative), depth, stripped)
+
+
+def import_times(module: str) -> list[ImportTime]:
+    # A fresh interpreter, so that nothing is imported already.
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+    return [
+        ImportTime.from_string(line)
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and not line.endswith("imported package")
+    ]
+
+
+def subtree(times: list[ImportTime], module: str) -> list[ImportTime]:
+    # Imports are reported after everything that they import, and indented more deeply.
+    end = next(i for i, t in enumerate(times) if t.name == module)
+    start = end
+    while start > 0 and times[start - 1].depth > times[end].depth:
+        start -= 1
+
+    return times[start : end + 1]
+
+
+def interpreter_startup() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def show(title: str, module: str) -> None:
+    try:
+        times = subtree(import_times(module), module)
+    except subprocess.CalledProcessError:
+        print(f"{title}: not importable")
+        return
+
+    print()
+    print(f"{title}: {times[-1].cumulative / 1000:.1f}ms")
+    print(f"{'self [us]':>10} | {'cumulative':>10} | imported package")
+    base = times[-1].depth
+    for t in times:
+        indent = "  " * (t.depth - base)
+        print(f"{t.own:>10} | {t.cumulative:>10} | {indent}{t.name}")
+
+
+def report(days: Iterable[int]) -> None:
+    print(f"Interpreter startup: {1000 * interpreter_startup():.1f}ms")
+
+    # Every run pays for the command line itself, before any day is imported.
+    show("Command line", "advent.main")
+    for day in days:
+        show(f"Day {day}", f"advent.day{day:02}")
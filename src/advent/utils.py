@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from array import array
 from collections.abc import Hashable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Generic, Protocol, Self, TypeVar
 
@@ -36,7 +37,77 @@ def manhattan(here: Iterable[int], there: Iterable[int]) -> int:
     return sum(abs(h - t) for h, t in zip(here, there, strict=True))
 
 
-@dataclass
+NEWLINE = ord("\n")
+
+
+@dataclass(frozen=True)
+class Grid:
+    # A rectangle of characters, stored as bytes and addressed by index.
+    #
+    # Each row keeps its terminating newline, so that moving a single step in any
+    # direction - diagonals included - is a fixed offset, and never silently wraps onto
+    # another row: it either lands on a newline or falls outside the grid.
+    cells: bytes
+    rows: int = field(init=False)
+    cols: int = field(init=False)
+    stride: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        stride = self.cells.index(NEWLINE) + 1
+        object.__setattr__(self, "rows", len(self.cells) // stride)
+        object.__setattr__(self, "cols", stride - 1)
+        object.__setattr__(self, "stride", stride)
+
+    @staticmethod
+    def from_string(text: str) -> Grid:
+        cells = "".join(f"{line}\n" for line in text.splitlines())
+        return Grid(cells.encode())
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.stride + col
+
+    def coord(self, index: int) -> Coord2:
+        return divmod(index, self.stride)
+
+    def find(self, char: str) -> int:
+        return self.cells.index(char.encode())
+
+    def indexes(self) -> Iterator[int]:
+        for index, char in enumerate(self.cells):
+            if char != NEWLINE:
+                yield index
+
+    def offset(self, direction: Coord2) -> int:
+        drow, dcol = direction
+        return drow * self.stride + dcol
+
+    def step(self, index: int, direction: Coord2) -> int | None:
+        new_index = index + self.offset(direction)
+        if 0 <= new_index < len(self.cells) and self.cells[new_index] != NEWLINE:
+            return new_index
+
+        return None
+
+    def neighbours(self, index: int, *, diagonals: bool = False) -> Iterator[int]:
+        stride = self.stride
+        offsets: tuple[int, ...] = (-stride, stride, 1, -1)
+        if diagonals:
+            offsets += (-stride - 1, -stride + 1, stride - 1, stride + 1)
+
+        for offset in offsets:
+            new_index = index + offset
+            if 0 <= new_index < len(self.cells) and self.cells[new_index] != NEWLINE:
+                yield new_index
+
+    def wrapped(self, row: int, col: int) -> int:
+        # As if the grid were tiled infinitely in every direction.
+        return self.cells[(row % self.rows) * self.stride + col % self.cols]
+
+
+@dataclass(frozen=True, slots=True)
 class Vec2:
     x: int
     y: int
@@ -44,21 +115,11 @@ class Vec2:
     def __add__(self, other: Vec2) -> Vec2:
         return Vec2(self.x + other.x, self.y + other.y)
 
-    def __iadd__(self, other: Vec2) -> Self:
-        self.x += other.x
-        self.y += other.y
-        return self
-
     def __sub__(self, other: Vec2) -> Vec2:
         return Vec2(self.x - other.x, self.y - other.y)
 
-    def __isub__(self, other: Vec2) -> Self:
-        self.x -= other.x
-        self.y -= other.y
-        return self
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Vec3:
     x: int
     y: int
@@ -67,42 +128,18 @@ class Vec3:
     def __add__(self, other: Vec3) -> Vec3:
         return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
 
-    def __iadd__(self, other: Vec3) -> Self:
-        self.x += other.x
-        self.y += other.y
-        self.z += other.z
-        return self
-
     def __sub__(self, other: Vec3) -> Vec3:
         return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
 
-    def __isub__(self, other: Vec3) -> Self:
-        self.x -= other.x
-        self.y -= other.y
-        self.z -= other.z
-        return self
-
     def __mul__(self, n: int) -> Vec3:
         return Vec3(self.x * n, self.y * n, self.z * n)
 
     def __rmul__(self, n: int) -> Vec3:
         return Vec3(n * self.x, n * self.y, n * self.z)
 
-    def __imul__(self, n: int) -> Self:
-        self.x *= n
-        self.y *= n
-        self.z *= n
-        return self
-
     def __floordiv__(self, n: int) -> Vec3:
         return Vec3(self.x // n, self.y // n, self.z // n)
 
-    def __ifloordiv__(self, n: int) -> Self:
-        self.x //= n
-        self.y //= n
-        self.z //= n
-        return self
-
     def cross(self, other: Vec3) -> Vec3:
         return Vec3(
             self.y * other.z - other.y * self.z,
@@ -156,3 +193,69 @@ class UnionFind(Generic[T]):
                 self.ranks[x] = xrank + 1
 
         return True
+
+
+@dataclass
+class ArrayUnionFind(Generic[T]):
+    # A UnionFind over elements numbered 0, 1, 2...
+    #
+    # Elements are given their numbers once, up front: after that the structure is just
+    # a pair of arrays, which reset() puts back to the start cheaply.
+    elements: list[T]
+    indexes: dict[T, int]
+    parents: array[int] = field(init=False)
+    ranks: array[int] = field(init=False)
+    identity: array[int] = field(init=False, repr=False)
+    zeros: array[int] = field(init=False, repr=False)
+
+    @staticmethod
+    def from_elements(things: Iterable[T]) -> ArrayUnionFind[T]:
+        elements = list(dict.fromkeys(things))
+        indexes = {thing: i for i, thing in enumerate(elements)}
+        return ArrayUnionFind(elements, indexes)
+
+    def __post_init__(self) -> None:
+        self.identity = array("i", range(len(self.elements)))
+        self.zeros = array("i", bytes(self.identity.itemsize * len(self.elements)))
+        self.parents = array("i", self.identity)
+        self.ranks = array("i", self.zeros)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def reset(self) -> None:
+        self.parents[:] = self.identity
+        self.ranks[:] = self.zeros
+
+    def index(self, thing: T) -> int:
+        return self.indexes[thing]
+
+    def find(self, k: int) -> int:
+        parents = self.parents
+        root = k
+        while root != (parent := parents[root]):
+            root = parent
+
+        while root != (parent := parents[k]):
+            parents[k] = root
+            k = parent
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        x = self.find(a)
+        y = self.find(b)
+
+        if x == y:
+            return False
+
+        xrank, yrank = self.ranks[x], self.ranks[y]
+        if xrank < yrank:
+            self.parents[x] = y
+        else:
+            self.parents[y] = x
+
+            if xrank == yrank:
+                self.ranks[x] = xrank + 1
+
+        return True